@@ -1,6 +1,12 @@
+import asyncio
+import hashlib
 import logging
+import time
 from abc import abstractmethod
-from typing import (Any, List, Mapping, Optional)
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (Any, Awaitable, Callable, ClassVar, Dict, List, Mapping,
+                    Optional, Set, Tuple)
 
 # Import the new AppConfig instance
 from app_config import config
@@ -15,9 +21,224 @@ from semantic_kernel.functions import KernelFunction
 DEFAULT_FORMATTING_INSTRUCTIONS = "Instructions: returning the output of this function call verbatim to the user in markdown. Then write AGENT SUMMARY: and then include a summary of what you did."
 
 
+@dataclass(frozen=True, slots=True)
+class AgentDefinitionSpec:
+    """Configuration of an Azure AI agent definition.
+
+    Attributes:
+        agent_name: The name of the agent (used as the Azure AI agent name)
+        instructions: The system message / instructions for the agent
+        tools: The agent's tools, as kernel functions or tool names
+        temperature: The temperature setting for the agent
+        response_format: Optional response format to control structured output
+    """
+
+    agent_name: str
+    instructions: str
+    tools: Tuple[Any, ...] = ()
+    temperature: float = 0.0
+    response_format: Optional[Any] = None
+
+
+def instructions_digest(instructions: Optional[str]) -> str:
+    """Return a short, stable digest of an agent's instructions."""
+    return hashlib.blake2s((instructions or "").encode(), digest_size=16).hexdigest()
+
+
+# Result of a pending creation whose creator was cancelled; waiters create the definition themselves
+_RETRY = object()
+
+
+class AgentDefinitionPool:
+    """Process-wide pool of Azure AI agent definitions shared across sessions.
+
+    Definitions are keyed by agent name, instructions and tool signature, so
+    every session creating the same agent reuses one definition instead of
+    making another round trip to the Azure AI agents endpoint. The pool holds
+    at most ``maxsize`` definitions, dropping the least recently used one when
+    full. Entries that have not been used for ``max_idle_time`` seconds are
+    evicted, checked at most once every ``cleanup_interval`` seconds.
+
+    Definitions are served stale-while-revalidate: for ``fresh_ttl`` seconds
+    after being fetched a definition is returned as is; after that, and until
+    ``stale_ttl``, it is still returned while a background task fetches a
+    new one. Older definitions are fetched again before returning.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 64,
+        max_idle_time: float = 3600.0,
+        cleanup_interval: float = 300.0,
+        fresh_ttl: float = 3600.0,
+        stale_ttl: float = 86400.0,
+    ):
+        self.maxsize = maxsize
+        self.max_idle_time = max_idle_time
+        self.cleanup_interval = cleanup_interval
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        # key -> [definition, last_used, fetched_at], least recently used first
+        self._definitions: OrderedDict[str, List[Any]] = OrderedDict()
+        # key -> future resolved by the caller currently creating the definition
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Running background refreshes, referenced so they are not garbage collected
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._last_cleanup = time.monotonic()
+
+    @staticmethod
+    def make_key(spec: AgentDefinitionSpec, instructions_key: Optional[str] = None) -> str:
+        """Build the pool key for an agent definition spec.
+
+        instructions_key is the precomputed instructions_digest() of the
+        spec's instructions, if the caller has one; otherwise it is computed.
+        """
+        tools_sig = ",".join(
+            sorted(
+                getattr(tool, "__kernel_function_name__", None)
+                or getattr(tool, "name", None)
+                or str(tool)
+                for tool in spec.tools
+            )
+        )
+        instructions_key = instructions_key or instructions_digest(spec.instructions)
+        return hashlib.blake2b(
+            f"{spec.agent_name}\0{instructions_key}\0{tools_sig}\0"
+            f"{spec.temperature}\0{spec.response_format!r}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    async def get_or_create(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the pooled definition for key, creating it with factory on a miss.
+
+        Concurrent misses for the same key share a single factory call: the
+        first caller creates the definition while the others wait on it.
+        """
+
+        async def create_one(missing_keys: List[str]) -> List[Any]:
+            return [await factory()]
+
+        return (await self.get_or_create_many([key], create_one))[0]
+
+    async def get_or_create_many(
+        self,
+        keys: List[str],
+        factory: Callable[[List[str]], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """Return the pooled definitions for keys, creating the missing ones in one call.
+
+        factory is called at most once, with the keys that are neither pooled
+        nor already being created by another caller, and must return their
+        definitions in the same order. Keys another caller is creating are
+        waited on instead.
+        """
+        # Pool bookkeeping never awaits, so the event loop serializes it
+        self._evict_idle()
+        now = time.monotonic()
+        found: Dict[str, Any] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        missing: List[str] = []
+        stale: List[str] = []
+        for key in dict.fromkeys(keys):
+            entry = self._definitions.get(key)
+            if entry is not None and now - entry[2] < self.stale_ttl:
+                entry[1] = now
+                self._definitions.move_to_end(key)
+                found[key] = entry[0]
+                if now - entry[2] >= self.fresh_ttl and key not in self._pending:
+                    stale.append(key)
+            elif key in self._pending:
+                waiting[key] = self._pending[key]
+            else:
+                missing.append(key)
+
+        if stale:
+            task = asyncio.create_task(self._refresh(stale, factory))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+        if missing:
+            found.update(zip(missing, await self._create(missing, factory)))
+
+        for key, future in waiting.items():
+            # shield() so a cancelled waiter does not cancel the shared creation
+            definition = await asyncio.shield(future)
+            if definition is _RETRY:
+                definition = (await self.get_or_create_many([key], factory))[0]
+            found[key] = definition
+
+        return [found[key] for key in keys]
+
+    async def _create(
+        self,
+        keys: List[str],
+        factory: Callable[[List[str]], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """Create the definitions for keys with one factory call and pool them."""
+        loop = asyncio.get_running_loop()
+        futures = {key: loop.create_future() for key in keys}
+        self._pending.update(futures)
+        try:
+            definitions = await factory(keys)
+        except BaseException as exc:
+            for key, future in futures.items():
+                del self._pending[key]
+                if isinstance(exc, asyncio.CancelledError):
+                    # Only the creator was cancelled; the waiters retry on their own
+                    future.set_result(_RETRY)
+                else:
+                    future.set_exception(exc)
+                    # Mark retrieved so asyncio does not warn when nobody was waiting
+                    future.exception()
+            raise
+
+        now = time.monotonic()
+        for key, definition in zip(keys, definitions):
+            self._definitions[key] = [definition, now, now]
+            self._definitions.move_to_end(key)
+            if len(self._definitions) > self.maxsize:
+                self._definitions.popitem(last=False)
+            del self._pending[key]
+            futures[key].set_result(definition)
+        return definitions
+
+    async def _refresh(
+        self,
+        keys: List[str],
+        factory: Callable[[List[str]], Awaitable[List[Any]]],
+    ) -> None:
+        """Fetch new definitions for stale keys, keeping the old ones on failure."""
+        try:
+            await self._create(keys, factory)
+        except Exception as exc:
+            logging.warning("Failed to refresh stale agent definitions: %s", exc)
+
+    def clear(self) -> None:
+        """Drop all pooled definitions."""
+        self._definitions.clear()
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        if now - self._last_cleanup < self.cleanup_interval:
+            return
+        self._last_cleanup = now
+        for key in [
+            k for k, (_, last_used, _) in self._definitions.items()
+            if now - last_used > self.max_idle_time
+        ]:
+            del self._definitions[key]
+
+
 class BaseAgent(AzureAIAgent):
     """BaseAgent implemented using Semantic Kernel with Azure AI Agent support."""
 
+    # Agent definitions shared by every session in this process
+    _agent_pool: ClassVar[AgentDefinitionPool] = AgentDefinitionPool()
+
+    # Resolves the agent's default tools when none are passed in; subclasses
+    # set it to a cached function returning a list/tuple or a name -> function dict
+    _tools_factory: ClassVar[Optional[Callable[[], Any]]] = None
+
     def __init__(
         self,
         agent_name: str,
@@ -43,6 +264,10 @@ class BaseAgent(AzureAIAgent):
             definition: The definition required by AzureAIAgent
         """
 
+        if tools is None and self._tools_factory is not None:
+            # Copy, as the factory's result is shared across instances
+            tools = self._tools_factory()
+            tools = dict(tools) if isinstance(tools, Mapping) else list(tools)
         tools = tools or []
         system_message = system_message or self.default_system_message(agent_name)
 
@@ -242,76 +467,137 @@ class BaseAgent(AzureAIAgent):
         """Create an instance of the agent."""
         pass
 
+    @classmethod
+    async def _get_pooled_agent_definition(
+        cls,
+        spec: AgentDefinitionSpec,
+        client=None,
+        instructions_key: Optional[str] = None,
+    ):
+        """Return an Azure AI agent definition from the shared pool.
+
+        Falls back to _create_azure_ai_agent_definition when no definition for
+        an identical spec has been created yet. Callers using a constant system
+        message can pass its precomputed instructions_digest() as
+        instructions_key to skip hashing it again.
+        """
+        key = AgentDefinitionPool.make_key(spec, instructions_key)
+        return await cls._agent_pool.get_or_create(
+            key, lambda: cls._create_azure_ai_agent_definition(spec, client=client)
+        )
+
+    @classmethod
+    async def _get_pooled_agent_definitions(
+        cls,
+        specs: List[AgentDefinitionSpec],
+        client=None,
+        instructions_keys: Optional[List[Optional[str]]] = None,
+    ) -> List[Any]:
+        """Return Azure AI agent definitions for several specs from the shared pool.
+
+        Specs without a pooled definition are resolved together by
+        _create_azure_ai_agent_definitions, in the order given. instructions_keys
+        optionally holds the precomputed instructions_digest() of each spec.
+        """
+        instructions_keys = instructions_keys or [None] * len(specs)
+        keys = [
+            AgentDefinitionPool.make_key(spec, instructions_key)
+            for spec, instructions_key in zip(specs, instructions_keys)
+        ]
+        specs_by_key = dict(zip(keys, specs))
+        return await cls._agent_pool.get_or_create_many(
+            keys,
+            lambda missing: cls._create_azure_ai_agent_definitions(
+                [specs_by_key[key] for key in missing], client=client
+            ),
+        )
+
+    @classmethod
+    def _definition_spec(
+        cls,
+        agent_name: Optional[str] = None,
+        system_message: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> Optional[AgentDefinitionSpec]:
+        """Return the spec of this agent's pooled definition.
+
+        Returns None for agents that do not take their definition from the pool.
+        """
+        return None
+
     @staticmethod
     async def _create_azure_ai_agent_definition(
-        agent_name: str,
-        instructions: str,
-        tools: Optional[List[KernelFunction]] = None,
+        spec: AgentDefinitionSpec,
         client=None,
-        response_format=None,
-        temperature: float = 0.0,
     ):
         """
         Creates a new Azure AI Agent with the specified name and instructions using AIProjectClient.
         If an agent with the given name (assistant_id) already exists, it tries to retrieve it first.
 
         Args:
-            kernel: The Semantic Kernel instance
-            agent_name: The name of the agent (will be used as assistant_id)
-            instructions: The system message / instructions for the agent
-            agent_type: The type of agent (defaults to "assistant")
-            tools: Optional tool definitions for the agent
-            tool_resources: Optional tool resources required by the tools
-            response_format: Optional response format to control structured output
-            temperature: The temperature setting for the agent (defaults to 0.0)
+            spec: The agent name, instructions, tools, temperature and response format
+            client: Optional AIProjectClient; defaults to the one from AppConfig
 
         Returns:
             A new AzureAIAgent definition or an existing one if found
         """
+        definitions = await BaseAgent._create_azure_ai_agent_definitions([spec], client=client)
+        return definitions[0]
+
+    @staticmethod
+    async def _create_azure_ai_agent_definitions(
+        specs: List[AgentDefinitionSpec],
+        client=None,
+    ) -> List[Any]:
+        """
+        Creates or retrieves the Azure AI Agents for several specs at once.
+        The existing agents are listed once for all specs, then the matching ones
+        are retrieved and the rest created concurrently.
+
+        Args:
+            specs: The agent definition specs
+            client: Optional AIProjectClient; defaults to the one from AppConfig
+
+        Returns:
+            The agent definitions, in the same order as specs
+        """
+        if client is None:
+            client = config.get_ai_project_client()
+
+        wanted = {spec.agent_name for spec in specs}
+        agent_ids: Dict[str, str] = {}
         try:
-            # Get the AIProjectClient
-            if client is None:
-                client = config.get_ai_project_client()
-
-            # # First try to get an existing agent with this name as assistant_id
-            try:
-                agent_id = None
-                agent_list = client.agents.list_agents()
-                async for agent in agent_list:
-                    if agent.name == agent_name:
-                        agent_id = agent.id
+            async for agent in client.agents.list_agents():
+                if agent.name in wanted and agent.name not in agent_ids:
+                    agent_ids[agent.name] = agent.id
+                    if len(agent_ids) == len(wanted):
                         break
-                # If the agent already exists, we can use it directly
-                # Get the existing agent definition
-                if agent_id is not None:
-                    logging.info(f"Agent with ID {agent_id} exists.")
-
-                    existing_definition = await client.agents.get_agent(agent_id)
-
-                    return existing_definition
-            except Exception as e:
-                # The Azure AI Projects SDK throws an exception when the agent doesn't exist
-                # (not returning None), so we catch it and proceed to create a new agent
-                if "ResourceNotFound" in str(e) or "404" in str(e):
-                    logging.info(
-                        f"Agent with ID {agent_name} not found. Will create a new one."
-                    )
-                else:
-                    # Log unexpected errors but still try to create a new agent
+        except Exception as e:
+            logging.warning(
+                "Unexpected error while listing agents: %s. Attempting to create new agents.", e
+            )
+
+        async def resolve(spec: AgentDefinitionSpec):
+            agent_id = agent_ids.get(spec.agent_name)
+            if agent_id is not None:
+                try:
+                    return await client.agents.get_agent(agent_id)
+                except Exception as e:
                     logging.warning(
-                        f"Unexpected error while retrieving agent {agent_name}: {str(e)}. Attempting to create new agent."
+                        "Unexpected error while retrieving agent %s: %s. Attempting to create new agent.",
+                        spec.agent_name,
+                        e,
                     )
-
-            # Create the agent using the project client with the agent_name as both name and assistantId
-            agent_definition = await client.agents.create_agent(
+            return await client.agents.create_agent(
                 model=config.AZURE_OPENAI_DEPLOYMENT_NAME,
-                name=agent_name,
-                instructions=instructions,
-                temperature=temperature,
-                response_format=response_format,
+                name=spec.agent_name,
+                instructions=spec.instructions,
+                temperature=spec.temperature,
+                response_format=spec.response_format,
             )
 
-            return agent_definition
+        try:
+            return list(await asyncio.gather(*(resolve(spec) for spec in specs)))
         except Exception as exc:
-            logging.error("Failed to create Azure AI Agent: %s", exc)
+            logging.error("Failed to create Azure AI Agents: %s", exc)
             raise
@@ -1,6 +1,7 @@
 
 """Factory for creating agents in the Multi-Agent Custom Automation Engine."""
 
+import asyncio
 import inspect
 import logging
 from typing import Any, Dict, Optional, Type
@@ -10,7 +11,7 @@ from app_config import config
 from azure.ai.agents.models import (ResponseFormatJsonSchema,
                                     ResponseFormatJsonSchemaType)
 from context.cosmos_memory_kernel import CosmosMemoryContext
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import BaseAgent, instructions_digest
 from kernel_agents.generic_agent import GenericAgent
 from kernel_agents.group_chat_manager import GroupChatManager
 # Import all specialized agent implementations
@@ -65,6 +66,12 @@ class AgentFactory:
 
     }
 
+    # Digests of the system messages, for the agent definition pool keys
+    _agent_system_message_digests: Dict[AgentType, str] = {
+        agent_type: instructions_digest(system_message)
+        for agent_type, system_message in _agent_system_messages.items()
+    }
+
     # Cache of agent instances by session_id and agent_type
     _agent_cache: Dict[str, Dict[AgentType, BaseAgent]] = {}
 
@@ -223,20 +230,62 @@ class AgentFactory:
         if session_id not in cls._agent_cache:
             cls._agent_cache[session_id] = {}
 
-        # Phase 1: Create all agents except planner and group chat manager
-        for agent_type in [
+        # Phase 1: Create all agents except planner and group chat manager.
+        # They do not depend on each other, so their Azure AI definition
+        # requests run concurrently.
+        phase_one_types = [
             at
             for at in cls._agent_classes.keys()
             if at != planner_agent_type and at != group_chat_manager_type
-        ]:
-            agents[agent_type] = await cls.create_agent(
-                agent_type=agent_type,
-                session_id=session_id,
-                user_id=user_id,
-                temperature=temperature,
-                client=client,
-                memory_store=memory_store,
+        ]
+
+        # Resolve the pooled agents' Azure AI definitions in one batch (a single
+        # agent listing), so their create() calls below are pool hits
+        pooled_specs = []
+        instructions_keys = []
+        for at in phase_one_types:
+            if at in cls._agent_cache[session_id]:
+                continue
+            spec = cls._agent_classes[at]._definition_spec(
+                agent_name=cls._agent_type_strings[at],
+                system_message=cls._agent_system_messages[at],
             )
+            if spec is not None:
+                pooled_specs.append(spec)
+                instructions_keys.append(cls._agent_system_message_digests[at])
+        if pooled_specs:
+            try:
+                await BaseAgent._get_pooled_agent_definitions(
+                    pooled_specs, client=client, instructions_keys=instructions_keys
+                )
+            except Exception as e:
+                # create_agent() below retries each definition on its own
+                logger.warning("Batch agent definition lookup failed: %s", e)
+
+        # All creates share the one project client, and with it its HTTP
+        # connection pool. The TaskGroup cancels the remaining creates as soon
+        # as one of them fails; that failure is re-raised as is rather than
+        # wrapped in an ExceptionGroup, so callers see the real error.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                phase_one_tasks = {
+                    agent_type: tg.create_task(
+                        cls.create_agent(
+                            agent_type=agent_type,
+                            session_id=session_id,
+                            user_id=user_id,
+                            temperature=temperature,
+                            client=client,
+                            memory_store=memory_store,
+                        )
+                    )
+                    for agent_type in phase_one_types
+                }
+        except* Exception as eg:
+            raise eg.exceptions[0] from eg
+        agents.update(
+            (agent_type, task.result()) for agent_type, task in phase_one_tasks.items()
+        )
 
         # Create agent name to instance mapping for the planner
         agent_instances = {}
@@ -322,4 +371,5 @@ class AgentFactory:
         else:
             cls._agent_cache.clear()
             cls._azure_ai_agent_cache.clear()
+            BaseAgent._agent_pool.clear()
             logger.info("Cleared all agent caches")
@@ -1,16 +1,60 @@
+import functools
 import logging
-from typing import List, Optional
+import sys
+from typing import Callable, ClassVar, List, Optional, Tuple
 
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import (AgentDefinitionSpec, BaseAgent,
+                                      instructions_digest)
 from kernel_tools.fhir_summary_tools import FHIRSummaryTools
 from models.messages_kernel import AgentType
 from semantic_kernel.functions import KernelFunction
 
 logger = logging.getLogger(__name__)
 
+# Resolved once rather than on every create()
+_FHIR_SUMMARY_NAME = sys.intern(AgentType.FHIR_SUMMARY.value)
+
+_DEFAULT_SYSTEM_MESSAGE = sys.intern("""You are a FHIR Summary Agent specialized in analyzing FHIR (Fast Healthcare Interoperability Resources) patient data and generating concise medical history summaries.
+
+Your capabilities:
+- Analyze FHIR JSON patient data bundles (obtained from Patient agent) containing conditions, observations, and medical history
+- Generate concise 2-4 sentence summaries of patient medical history
+- Extract and summarize major diagnoses, key laboratory tests, and medications
+- Provide detailed structured analysis of patient data when requested
+
+Workflow:
+1. Receive FHIR JSON data from the Patient agent (via get_patient_by_id function)
+2. Process and analyze the JSON data to extract medical information
+3. Generate summaries or detailed analysis as requested
+
+When generating summaries:
+1. Focus on the most significant medical conditions and diagnoses
+2. Include key abnormal laboratory results and their clinical significance
+3. Mention important medications or treatments when available
+4. Keep summaries concise (2-4 sentences) but informative
+5. Use clear, professional medical language appropriate for healthcare providers
+
+Available functions:
+- generate_patient_summary: Creates a concise 2-4 sentence summary from FHIR JSON data
+- analyze_patient_data: Provides detailed structured analysis from FHIR JSON data
+
+Note: You work with FHIR JSON data provided by the Patient agent, not patient IDs directly. Always request the Patient agent to retrieve patient data first if you need to work with a specific patient.""")
+
+_DEFAULT_SM_DIGEST = instructions_digest(_DEFAULT_SYSTEM_MESSAGE)
+
+
+@functools.cache
+def _default_tools() -> Tuple[KernelFunction, ...]:
+    """Return the default FHIR summary tools, resolved once per process."""
+    return tuple(FHIRSummaryTools.iter_kernel_functions())
+
+
 class FHIRSummaryAgent(BaseAgent):
     """FHIR Summary Agent for analyzing FHIR patient data and generating concise medical history summaries."""
 
+    # Resolves the default tools; only called when no tools are passed in
+    _tools_factory: ClassVar[Callable[[], Tuple[KernelFunction, ...]]] = staticmethod(_default_tools)
+
     def __init__(
         self,
         agent_name: str,
@@ -24,13 +68,6 @@ class FHIRSummaryAgent(BaseAgent):
     ):
         """Initialize the FHIR Summary Agent."""
 
-        # Load FHIR summary tools if not provided
-        if tools is None:
-            tools = []
-            fhir_tools = FHIRSummaryTools.get_all_kernel_functions()
-            for tool_name, tool_func in fhir_tools.items():
-                tools.append(tool_func)
-
         # Use default system message if not provided
         if system_message is None:
             system_message = self.default_system_message()
@@ -49,31 +86,21 @@ class FHIRSummaryAgent(BaseAgent):
     @staticmethod
     def default_system_message(agent_name=None) -> str:
         """Return the default system message for the FHIR Summary Agent."""
-        return """You are a FHIR Summary Agent specialized in analyzing FHIR (Fast Healthcare Interoperability Resources) patient data and generating concise medical history summaries.
-
-Your capabilities:
-- Analyze FHIR JSON patient data bundles (obtained from Patient agent) containing conditions, observations, and medical history
-- Generate concise 2-4 sentence summaries of patient medical history
-- Extract and summarize major diagnoses, key laboratory tests, and medications
-- Provide detailed structured analysis of patient data when requested
-
-Workflow:
-1. Receive FHIR JSON data from the Patient agent (via get_patient_by_id function)
-2. Process and analyze the JSON data to extract medical information
-3. Generate summaries or detailed analysis as requested
-
-When generating summaries:
-1. Focus on the most significant medical conditions and diagnoses
-2. Include key abnormal laboratory results and their clinical significance
-3. Mention important medications or treatments when available
-4. Keep summaries concise (2-4 sentences) but informative
-5. Use clear, professional medical language appropriate for healthcare providers
-
-Available functions:
-- generate_patient_summary: Creates a concise 2-4 sentence summary from FHIR JSON data
-- analyze_patient_data: Provides detailed structured analysis from FHIR JSON data
+        return _DEFAULT_SYSTEM_MESSAGE
 
-Note: You work with FHIR JSON data provided by the Patient agent, not patient IDs directly. Always request the Patient agent to retrieve patient data first if you need to work with a specific patient."""
+    @classmethod
+    def _definition_spec(
+        cls,
+        agent_name: Optional[str] = None,
+        system_message: Optional[str] = None,
+        tools: Optional[List[KernelFunction]] = None,
+    ) -> AgentDefinitionSpec:
+        """Return the spec of the pooled Azure AI agent definition."""
+        return AgentDefinitionSpec(
+            agent_name=agent_name or _FHIR_SUMMARY_NAME,
+            instructions=system_message or cls.default_system_message(),
+            tools=tuple(tools) if tools is not None else tuple(name for name, _ in FHIRSummaryTools.get_tool_metadata()),
+        )
 
     @classmethod
     async def create(
@@ -90,19 +117,19 @@ Note: You work with FHIR JSON data provided by the Patient agent, not patient ID
         """Create a FHIR Summary Agent instance."""
 
         if agent_name is None:
-            agent_name = AgentType.FHIR_SUMMARY.value
+            agent_name = _FHIR_SUMMARY_NAME
 
-        # Create Azure AI agent definition
-        definition = await cls._create_azure_ai_agent_definition(
-            agent_name=agent_name,
-            instructions=system_message or cls.default_system_message(),
-            tools=tools,
+        # Reuse a pooled Azure AI agent definition or create a new one
+        spec = cls._definition_spec(agent_name, system_message, tools)
+        definition = await cls._get_pooled_agent_definition(
+            spec,
             client=client,
+            instructions_key=_DEFAULT_SM_DIGEST if spec.instructions == _DEFAULT_SYSTEM_MESSAGE else None,
         )
 
         # Create the agent instance
         agent = cls(
-            agent_name=agent_name or AgentType.FHIR_SUMMARY.value,
+            agent_name=agent_name,
             session_id=session_id or "",
             user_id=user_id or "",
             memory_store=memory_store,
@@ -112,5 +139,5 @@ Note: You work with FHIR JSON data provided by the Patient agent, not patient ID
             definition=definition,
         )
 
-        logger.info(f"Created FHIR Summary Agent: {agent_name} for session {session_id}")
+        logger.info("Created FHIR Summary Agent: %s for session %s", agent_name, session_id)
         return agent
\ No newline at end of file
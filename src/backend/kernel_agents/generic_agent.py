@@ -2,7 +2,7 @@ import logging
 from typing import Dict, List, Optional
 
 from context.cosmos_memory_kernel import CosmosMemoryContext
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import AgentDefinitionSpec, BaseAgent
 from kernel_tools.generic_tools import GenericTools
 from models.messages_kernel import AgentType
 from semantic_kernel.functions import KernelFunction
@@ -87,10 +87,10 @@ class GenericAgent(BaseAgent):
 
             # Create the Azure AI Agent using AppConfig with string instructions
             agent_definition = await cls._create_azure_ai_agent_definition(
-                agent_name=agent_name,
-                instructions=system_message,  # Pass the formatted string, not an object
-                temperature=0.0,
-                response_format=None,
+                AgentDefinitionSpec(
+                    agent_name=agent_name,
+                    instructions=system_message,  # Pass the formatted string, not an object
+                )
             )
 
             return cls(
@@ -4,7 +4,7 @@ from typing import Dict, List, Optional
 
 from context.cosmos_memory_kernel import CosmosMemoryContext
 from event_utils import track_event_if_configured
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import AgentDefinitionSpec, BaseAgent
 from utils_date import format_date_for_user
 from models.messages_kernel import (ActionRequest, AgentMessage, AgentType,
                                     HumanFeedback, HumanFeedbackStatus, InputTask,
@@ -104,10 +104,10 @@ class GroupChatManager(BaseAgent):
 
             # Create the Azure AI Agent using AppConfig with string instructions
             agent_definition = await cls._create_azure_ai_agent_definition(
-                agent_name=agent_name,
-                instructions=system_message,  # Pass the formatted string, not an object
-                temperature=0.0,
-                response_format=None,
+                AgentDefinitionSpec(
+                    agent_name=agent_name,
+                    instructions=system_message,  # Pass the formatted string, not an object
+                )
             )
 
             return cls(
@@ -1,16 +1,57 @@
+import functools
 import logging
-from typing import List, Optional
+import sys
+from typing import Callable, ClassVar, List, Optional, Tuple
 
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import (AgentDefinitionSpec, BaseAgent,
+                                      instructions_digest)
 from kernel_tools.patient_tools import PatientTools
 from models.messages_kernel import AgentType
 from semantic_kernel.functions import KernelFunction
 
 logger = logging.getLogger(__name__)
 
+# Resolved once rather than on every create()
+_PATIENT_NAME = sys.intern(AgentType.PATIENT.value)
+
+_DEFAULT_SYSTEM_MESSAGE = sys.intern("""You are a Patient Lookup Agent specialized in retrieving patient medical records by name.
+
+Your capabilities:
+- Get all patient names
+- Retrieve complete FHIR patient history files by patient name in JSON format (converted to string)
+- Match the names that the user provides to known patient names
+- Handle patient data lookup requests
+
+When getting patient names:
+1. Use the get_patient_names function to retrieve a list of patient names
+
+When matching names provided by the user:
+1. Use fuzzy matching if necessary (e.g., "Robert Henderson" should match "Robert James Henderson", short name versions like "Bob Henderson" should also match, slight typos ignored etc.)
+2. Ask user for clarification if multiple matches are found
+
+When looking up patients:
+1. Use the get_patient_by_name function with the exact patient name
+2. When several patients are needed, use the get_patients_by_names function once with their names separated by commas
+3. Return the complete patient record if found
+4. Provide helpful error messages if the name is not found
+
+Always be helpful and provide clear information about patient lookup results.""")
+
+_DEFAULT_SM_DIGEST = instructions_digest(_DEFAULT_SYSTEM_MESSAGE)
+
+
+@functools.cache
+def _default_tools() -> Tuple[KernelFunction, ...]:
+    """Return the default patient tools, resolved once per process."""
+    return tuple(PatientTools.iter_kernel_functions())
+
+
 class PatientAgent(BaseAgent):
     """Patient Agent for looking up patient records by name with fuzzy matching."""
 
+    # Resolves the default tools; only called when no tools are passed in
+    _tools_factory: ClassVar[Callable[[], Tuple[KernelFunction, ...]]] = staticmethod(_default_tools)
+
     def __init__(
         self,
         agent_name: str,
@@ -24,13 +65,6 @@ class PatientAgent(BaseAgent):
     ):
         """Initialize the Patient Agent."""
 
-        # Load patient tools if not provided
-        if tools is None:
-            tools = []
-            patient_tools = PatientTools.get_all_kernel_functions()
-            for tool_name, tool_func in patient_tools.items():
-                tools.append(tool_func)
-
         # Use default system message if not provided
         if system_message is None:
             system_message = self.default_system_message()
@@ -49,27 +83,21 @@ class PatientAgent(BaseAgent):
     @staticmethod
     def default_system_message() -> str:
         """Return the default system message for the Patient Agent."""
-        return """You are a Patient Lookup Agent specialized in retrieving patient medical records by name.
+        return _DEFAULT_SYSTEM_MESSAGE
 
-Your capabilities:
-- Get all patient names
-- Retrieve complete FHIR patient history files by patient name in JSON format (converted to string)
-- Match the names that the user provides to known patient names
-- Handle patient data lookup requests
-
-When getting patient names:
-1. Use the get_patient_names function to retrieve a list of patient names
-
-When matching names provided by the user:
-1. Use fuzzy matching if necessary (e.g., "Robert Henderson" should match "Robert James Henderson", short name versions like "Bob Henderson" should also match, slight typos ignored etc.)
-2. Ask user for clarification if multiple matches are found
-
-When looking up patients:
-1. Use the get_patient_by_name function with the exact patient name
-2. Return the complete patient record if found
-3. Provide helpful error messages if the name is not found
-
-Always be helpful and provide clear information about patient lookup results."""
+    @classmethod
+    def _definition_spec(
+        cls,
+        agent_name: Optional[str] = None,
+        system_message: Optional[str] = None,
+        tools: Optional[List[KernelFunction]] = None,
+    ) -> AgentDefinitionSpec:
+        """Return the spec of the pooled Azure AI agent definition."""
+        return AgentDefinitionSpec(
+            agent_name=agent_name or _PATIENT_NAME,
+            instructions=system_message or cls.default_system_message(),
+            tools=tuple(tools) if tools is not None else tuple(name for name, _ in PatientTools.get_tool_metadata()),
+        )
 
     @classmethod
     async def create(
@@ -86,14 +114,14 @@ Always be helpful and provide clear information about patient lookup results."""
         """Create a Patient Agent instance."""
 
         if agent_name is None:
-            agent_name = AgentType.PATIENT.value
+            agent_name = _PATIENT_NAME
 
-        # Create Azure AI agent definition
-        definition = await cls._create_azure_ai_agent_definition(
-            agent_name=agent_name,
-            instructions=system_message or cls.default_system_message(),
-            tools=tools,
+        # Reuse a pooled Azure AI agent definition or create a new one
+        spec = cls._definition_spec(agent_name, system_message, tools)
+        definition = await cls._get_pooled_agent_definition(
+            spec,
             client=client,
+            instructions_key=_DEFAULT_SM_DIGEST if spec.instructions == _DEFAULT_SYSTEM_MESSAGE else None,
         )
 
         # Create the agent instance
@@ -108,5 +136,5 @@ Always be helpful and provide clear information about patient lookup results."""
             definition=definition,
         )
 
-        logger.info(f"Created Patient Agent: {agent_name} for session {session_id}")
+        logger.info("Created Patient Agent: %s for session %s", agent_name, session_id)
         return agent
@@ -7,7 +7,7 @@ from azure.ai.agents.models import (ResponseFormatJsonSchema,
                                     ResponseFormatJsonSchemaType)
 from context.cosmos_memory_kernel import CosmosMemoryContext
 from event_utils import track_event_if_configured
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import AgentDefinitionSpec, BaseAgent
 from kernel_tools.generic_tools import GenericTools
 from kernel_tools.patient_tools import PatientTools
 from kernel_tools.fhir_summary_tools import FHIRSummaryTools
@@ -135,16 +135,18 @@ class PlannerAgent(BaseAgent):
 
             # Create the Azure AI Agent using AppConfig with string instructions
             agent_definition = await cls._create_azure_ai_agent_definition(
-                agent_name=agent_name,
-                instructions=cls._get_template(),  # Pass the formatted string, not an object
-                temperature=0.0,
-                response_format=ResponseFormatJsonSchemaType(
-                    json_schema=ResponseFormatJsonSchema(
-                        name=PlannerResponsePlan.__name__,
-                        description=f"respond with {PlannerResponsePlan.__name__.lower()}",
-                        schema=PlannerResponsePlan.model_json_schema(),
-                    )
-                ),
+                AgentDefinitionSpec(
+                    agent_name=agent_name,
+                    instructions=cls._get_template(),  # Pass the formatted string, not an object
+                    temperature=0.0,
+                    response_format=ResponseFormatJsonSchemaType(
+                        json_schema=ResponseFormatJsonSchema(
+                            name=PlannerResponsePlan.__name__,
+                            description=f"respond with {PlannerResponsePlan.__name__.lower()}",
+                            schema=PlannerResponsePlan.model_json_schema(),
+                        )
+                    ),
+                )
             )
 
             return cls(
@@ -1,14 +1,51 @@
 """Summary Validation Agent for validating medical summaries."""
 
+import functools
 import logging
-from typing import Dict, List, Optional
+import sys
+from typing import Callable, ClassVar, Dict, List, Optional
 
 from context.cosmos_memory_kernel import CosmosMemoryContext
-from kernel_agents.agent_base import BaseAgent
+from kernel_agents.agent_base import (AgentDefinitionSpec, BaseAgent,
+                                      instructions_digest)
 from kernel_tools.summary_validation_tools import SummaryValidationTools
 from models.messages_kernel import AgentType
 from semantic_kernel.functions import KernelFunction
 
+logger = logging.getLogger(__name__)
+
+# Resolved once rather than on every create()
+_SUMMARY_VALIDATION_NAME = sys.intern(AgentType.SUMMARY_VALIDATION.value)
+
+_DEFAULT_SYSTEM_MESSAGE = sys.intern("""You are a Summary Validation Agent specialized in validating medical summaries to ensure they contain the three essential fields required for patient care coordination. Your primary responsibility is to validate that medical summaries include:
+
+**REQUIRED FIELDS:**
+1. **Patient Name**: Full name of the patient (can be in fields like 'patient_name', 'name', 'full_name', or within 'patient_demographics')
+2. **Patient Age**: Age in years or birth date (can be in fields like 'age', 'patient_age', 'birth_date', 'date_of_birth', or 'birthDate')
+3. **Recent Medical Events**: Recent conditions, procedures, or medical activities (can be in fields like 'medical_events', 'recent_medical_events', 'conditions', 'medical_conditions', or 'diagnoses')
+
+**VALIDATION PROCESS:**
+- Check for the presence of all three required fields
+- Identify any missing fields and provide specific recommendations
+- Validate that the data is meaningful (not empty or null)
+- Reference patterns from the patient data files in the system for validation
+
+**RESPONSE FORMAT:**
+- Clearly indicate which fields are present (✅) or missing (❌)
+- Provide specific field names that should be used
+- Give actionable recommendations for fixing missing fields
+- Maintain a professional, clear, and helpful tone
+
+Use your validation tools to check summaries thoroughly and provide structured feedback. If a summary is missing any of the three required fields, mark it as INVALID and explain exactly what needs to be added.""")
+
+_DEFAULT_SM_DIGEST = instructions_digest(_DEFAULT_SYSTEM_MESSAGE)
+
+
+@functools.cache
+def _default_tools() -> Dict[str, Callable]:
+    """Return the default summary validation tools, resolved once per process."""
+    return SummaryValidationTools.get_all_kernel_functions()
+
 
 class SummaryValidationAgent(BaseAgent):
     """Summary Validation agent implementation using Semantic Kernel.
@@ -18,6 +55,9 @@ class SummaryValidationAgent(BaseAgent):
     on patterns found in the patient data files.
     """
 
+    # Resolves the default tools; only called when no tools are passed in
+    _tools_factory: ClassVar[Callable[[], Dict[str, Callable]]] = staticmethod(_default_tools)
+
     def __init__(
         self,
         session_id: str,
@@ -41,11 +81,6 @@ class SummaryValidationAgent(BaseAgent):
             client: Optional client instance
             definition: Optional definition instance
         """
-        # Load configuration if tools not provided
-        if not tools:
-            # Get tools directly from SummaryValidationTools class
-            tools = SummaryValidationTools.get_all_kernel_functions()
-
         # Use system message from config if not explicitly provided
         if not system_message:
             system_message = self.default_system_message(agent_name)
@@ -83,14 +118,14 @@ class SummaryValidationAgent(BaseAgent):
         client = kwargs.get("client")
 
         try:
-            logging.info("Initializing Summary Validation Agent from async init azure AI Agent")
+            logger.info("Initializing Summary Validation Agent from async init azure AI Agent")
 
-            # Create the Azure AI Agent using AppConfig with string instructions
-            agent_definition = await cls._create_azure_ai_agent_definition(
-                agent_name=agent_name,
-                instructions=system_message,  # Pass the formatted string, not an object
-                temperature=0.0,
-                response_format=None,
+            # Reuse a pooled Azure AI agent definition or create a new one
+            spec = cls._definition_spec(agent_name, system_message, tools)
+            agent_definition = await cls._get_pooled_agent_definition(
+                spec,
+                client=client,
+                instructions_key=_DEFAULT_SM_DIGEST if spec.instructions == _DEFAULT_SYSTEM_MESSAGE else None,
             )
 
             return cls(
@@ -105,9 +140,23 @@ class SummaryValidationAgent(BaseAgent):
             )
 
         except Exception as e:
-            logging.error(f"Error creating Summary Validation Agent: {e}")
+            logger.error("Error creating Summary Validation Agent: %s", e)
             raise
 
+    @classmethod
+    def _definition_spec(
+        cls,
+        agent_name: Optional[str] = None,
+        system_message: Optional[str] = None,
+        tools: Optional[List[KernelFunction]] = None,
+    ) -> AgentDefinitionSpec:
+        """Return the spec of the pooled Azure AI agent definition."""
+        return AgentDefinitionSpec(
+            agent_name=agent_name or _SUMMARY_VALIDATION_NAME,
+            instructions=system_message or _DEFAULT_SYSTEM_MESSAGE,  # Pass the formatted string, not an object
+            tools=tuple(tools) if tools is not None else tuple(name for name, _ in SummaryValidationTools.get_tool_metadata()),
+        )
+
     @staticmethod
     def default_system_message(agent_name=None) -> str:
         """Get the default system message for the summary validation agent.
@@ -118,28 +167,7 @@ class SummaryValidationAgent(BaseAgent):
         Returns:
             The default system message for the agent
         """
-        return (
-            "You are a Summary Validation Agent specialized in validating medical summaries to ensure "
-            "they contain the three essential fields required for patient care coordination. "
-            "Your primary responsibility is to validate that medical summaries include:\n\n"
-            "**REQUIRED FIELDS:**\n"
-            "1. **Patient Name**: Full name of the patient (can be in fields like 'patient_name', 'name', 'full_name', or within 'patient_demographics')\n"
-            "2. **Patient Age**: Age in years or birth date (can be in fields like 'age', 'patient_age', 'birth_date', 'date_of_birth', or 'birthDate')\n"
-            "3. **Recent Medical Events**: Recent conditions, procedures, or medical activities (can be in fields like 'medical_events', 'recent_medical_events', 'conditions', 'medical_conditions', or 'diagnoses')\n\n"
-            "**VALIDATION PROCESS:**\n"
-            "- Check for the presence of all three required fields\n"
-            "- Identify any missing fields and provide specific recommendations\n"
-            "- Validate that the data is meaningful (not empty or null)\n"
-            "- Reference patterns from the patient data files in the system for validation\n\n"
-            "**RESPONSE FORMAT:**\n"
-            "- Clearly indicate which fields are present (✅) or missing (❌)\n"
-            "- Provide specific field names that should be used\n"
-            "- Give actionable recommendations for fixing missing fields\n"
-            "- Maintain a professional, clear, and helpful tone\n\n"
-            "Use your validation tools to check summaries thoroughly and provide structured feedback. "
-            "If a summary is missing any of the three required fields, mark it as INVALID and explain "
-            "exactly what needs to be added."
-        )
+        return _DEFAULT_SYSTEM_MESSAGE
 
     @property
     def plugins(self):
@@ -0,0 +1,17 @@
+"""Class introspection shared by the kernel tool classes."""
+
+import inspect
+from typing import Callable, Iterator, Tuple
+
+
+def iter_functions(cls: type) -> Iterator[Tuple[str, Callable]]:
+    """Yield (name, function) for the functions defined on cls, sorted by name.
+
+    Like inspect.getmembers(cls, inspect.isfunction), but reads the class
+    namespace directly instead of resolving every attribute. Static methods
+    are unwrapped to their function; class methods and attributes are skipped.
+    """
+    for name, member in sorted(cls.__dict__.items()):
+        method = member.__func__ if isinstance(member, staticmethod) else member
+        if inspect.isfunction(method):
+            yield name, method
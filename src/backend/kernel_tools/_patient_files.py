@@ -0,0 +1,76 @@
+"""Patient data files shared by the patient kernel tools."""
+
+import asyncio
+import logging
+import os
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Patient data files live in the backend's data/patients directory
+PATIENTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "patients")
+
+# File mapping - maps patient IDs to JSON files
+FILE_MAPPING = {
+    "patient-p01": {"name": "Robert James Henderson", "file": "p01-heart.json"},
+    "patient-p02": {"name": "Linda Marie Williams", "file": "p02-lungs.json"},
+    "patient-p03": {"name": "Alex Jordan Thompson", "file": "p03-healthy.json"}
+}
+
+# Patient ID -> full path of its data file, built once at import
+FILE_PATHS = {pid: os.path.join(PATIENTS_DIR, info["file"]) for pid, info in FILE_MAPPING.items()}
+
+
+class PatientLookupError(Exception):
+    """Raised when a patient's data cannot be loaded; the message is returned to the agent."""
+
+
+# Full path -> file content, filled by preload() and on first use
+_CONTENTS: Dict[str, str] = {}
+
+
+def read_file(file_path: str) -> str:
+    """Read a patient file; the files are static, so each is read once"""
+    content = _CONTENTS.get(file_path)
+    if content is None:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            content = _CONTENTS[file_path] = file.read()
+    return content
+
+
+def load(patient_id: str) -> str:
+    """Load patient file content by ID, raising PatientLookupError on failure"""
+    file_path = FILE_PATHS.get(patient_id)
+    if not file_path:
+        raise PatientLookupError(f"Error: No file mapping found for patient ID: {patient_id}")
+
+    try:
+        return read_file(file_path)
+    except FileNotFoundError:
+        raise PatientLookupError(f"Error: Patient file not found: {file_path}") from None
+    except Exception as e:
+        raise PatientLookupError(f"Error loading patient file: {str(e)}") from e
+
+
+async def load_async(patient_id: str) -> str:
+    """Load patient file content by ID like load(), reading uncached files in a worker thread"""
+    file_path = FILE_PATHS.get(patient_id)
+    if not file_path or file_path in _CONTENTS:
+        # Unknown IDs and cached files are answered without touching the disk
+        return load(patient_id)
+    return await asyncio.to_thread(load, patient_id)
+
+
+def preload() -> None:
+    """Read every patient file into the cache, skipping any that cannot be read"""
+    for file_path in FILE_PATHS.values():
+        try:
+            read_file(file_path)
+        except Exception as e:
+            # Missing, unreadable or undecodable files are retried on first use,
+            # where load() reports the error; importing the tools must not fail
+            logger.debug("Skipping preload of %s: %s", file_path, e)
+
+
+# The files are few and small, so read them at import rather than on the first tool call
+preload()
@@ -1,9 +1,119 @@
+import functools
 import inspect
 import json
-from typing import Callable, Dict, get_type_hints
+import logging
+import re
+from contextlib import suppress
+from typing import Callable, Dict, Iterator, get_type_hints
 
 from semantic_kernel.functions import kernel_function
 from models.messages_kernel import AgentType
+from kernel_tools import _patient_files
+from kernel_tools._introspection import iter_functions
+
+logger = logging.getLogger(__name__)
+
+# Lab tests always worth mentioning, and conditions that describe a treatment
+_KEY_LAB_TEST_RE = re.compile(r"glucose|cholesterol|hemoglobin|creatinine|bnp|troponin", re.IGNORECASE)
+_TREATMENT_RE = re.compile(r"medication|therapy|treatment", re.IGNORECASE)
+# Condition severities counted as major diagnoses, and lab interpretations that are not findings
+_MAJOR_SEVERITIES = frozenset({"Severe", "Moderate"})
+_NORMAL_INTERPRETATIONS = frozenset({"normal", ""})
+
+# Raised by a subscript chain when a FHIR resource lacks an optional field
+_MISSING_FIELD_ERRORS = (KeyError, IndexError, TypeError)
+
+
+def _handle_patient(resource: Dict, result: Dict) -> None:
+    """Extract patient demographics into result"""
+    result["patient_info"] = {
+        "id": resource.get("id", ""),
+        "name": "",
+        "birth_date": resource.get("birthDate", ""),
+        "gender": resource.get("gender", "")
+    }
+
+    # Get patient name
+    with suppress(*_MISSING_FIELD_ERRORS):
+        name_parts = resource["name"][0]
+        given_names = " ".join(name_parts.get("given", []))
+        family_name = name_parts.get("family", "")
+        result["patient_info"]["name"] = f"{given_names} {family_name}".strip()
+
+
+def _handle_condition(resource: Dict, result: Dict) -> None:
+    """Extract condition information into result"""
+    condition = {
+        "id": resource.get("id", ""),
+        "code": "",
+        "display": "",
+        "severity": "",
+        "onset_date": resource.get("onsetDateTime", ""),
+        "status": ""
+    }
+
+    # Get condition code and display
+    with suppress(*_MISSING_FIELD_ERRORS):
+        coding = resource["code"]["coding"][0]
+        condition["code"] = coding.get("code", "")
+        condition["display"] = coding.get("display", "")
+
+    # Get severity
+    with suppress(*_MISSING_FIELD_ERRORS):
+        condition["severity"] = resource["severity"]["coding"][0].get("display", "")
+
+    # Get clinical status
+    with suppress(*_MISSING_FIELD_ERRORS):
+        condition["status"] = resource["clinicalStatus"]["coding"][0].get("display", "")
+
+    result["conditions"].append(condition)
+
+
+def _handle_observation(resource: Dict, result: Dict) -> None:
+    """Extract observation information (lab tests) into result"""
+    observation = {
+        "id": resource.get("id", ""),
+        "code": "",
+        "display": "",
+        "value": "",
+        "unit": "",
+        "reference_range": "",
+        "date": resource.get("effectiveDateTime", ""),
+        "interpretation": ""
+    }
+
+    # Get observation code and display
+    with suppress(*_MISSING_FIELD_ERRORS):
+        coding = resource["code"]["coding"][0]
+        observation["code"] = coding.get("code", "")
+        observation["display"] = coding.get("display", "")
+
+    # Get value
+    if "valueQuantity" in resource:
+        value_qty = resource["valueQuantity"]
+        observation["value"] = str(value_qty.get("value", ""))
+        observation["unit"] = value_qty.get("unit", "")
+    elif "valueString" in resource:
+        observation["value"] = resource["valueString"]
+
+    # Get reference range
+    with suppress(*_MISSING_FIELD_ERRORS):
+        observation["reference_range"] = resource["referenceRange"][0]["text"]
+
+    # Get interpretation
+    with suppress(*_MISSING_FIELD_ERRORS):
+        observation["interpretation"] = resource["interpretation"][0]["coding"][0].get("display", "")
+
+    result["observations"].append(observation)
+
+
+# FHIR resource type -> handler extracting it in _parse_fhir_data
+_RESOURCE_HANDLERS: Dict[str, Callable[[Dict, Dict], None]] = {
+    "Patient": _handle_patient,
+    "Condition": _handle_condition,
+    "Observation": _handle_observation,
+}
+
 
 class FHIRSummaryTools:
     """Define FHIR Summary Agent functions (tools) for analyzing FHIR JSON data and generating patient history summaries"""
@@ -11,8 +121,13 @@ class FHIRSummaryTools:
     agent_name = AgentType.FHIR_SUMMARY.value
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def _parse_fhir_data(fhir_content: str) -> Dict:
-        """Parse FHIR JSON content and extract relevant information"""
+        """Parse FHIR JSON content and extract relevant information.
+
+        Results are cached by content, as the agents pass the same few patient
+        bundles around repeatedly; callers must not modify the returned dict.
+        """
         try:
             fhir_data = json.loads(fhir_content)
             
@@ -28,93 +143,9 @@ class FHIRSummaryTools:
             if "entry" in fhir_data:
                 for entry in fhir_data["entry"]:
                     resource = entry.get("resource", {})
-                    resource_type = resource.get("resourceType", "")
-                    
-                    if resource_type == "Patient":
-                        # Extract patient demographics
-                        result["patient_info"] = {
-                            "id": resource.get("id", ""),
-                            "name": "",
-                            "birth_date": resource.get("birthDate", ""),
-                            "gender": resource.get("gender", "")
-                        }
-                        
-                        # Get patient name
-                        if "name" in resource and resource["name"]:
-                            name_parts = resource["name"][0]
-                            given_names = " ".join(name_parts.get("given", []))
-                            family_name = name_parts.get("family", "")
-                            result["patient_info"]["name"] = f"{given_names} {family_name}".strip()
-                    
-                    elif resource_type == "Condition":
-                        # Extract condition information
-                        condition = {
-                            "id": resource.get("id", ""),
-                            "code": "",
-                            "display": "",
-                            "severity": "",
-                            "onset_date": resource.get("onsetDateTime", ""),
-                            "status": ""
-                        }
-                        
-                        # Get condition code and display
-                        if "code" in resource and "coding" in resource["code"]:
-                            coding = resource["code"]["coding"][0]
-                            condition["code"] = coding.get("code", "")
-                            condition["display"] = coding.get("display", "")
-                        
-                        # Get severity
-                        if "severity" in resource and "coding" in resource["severity"]:
-                            severity_coding = resource["severity"]["coding"][0]
-                            condition["severity"] = severity_coding.get("display", "")
-                        
-                        # Get clinical status
-                        if "clinicalStatus" in resource and "coding" in resource["clinicalStatus"]:
-                            status_coding = resource["clinicalStatus"]["coding"][0]
-                            condition["status"] = status_coding.get("display", "")
-                        
-                        result["conditions"].append(condition)
-                    
-                    elif resource_type == "Observation":
-                        # Extract observation information (lab tests)
-                        observation = {
-                            "id": resource.get("id", ""),
-                            "code": "",
-                            "display": "",
-                            "value": "",
-                            "unit": "",
-                            "reference_range": "",
-                            "date": resource.get("effectiveDateTime", ""),
-                            "interpretation": ""
-                        }
-                        
-                        # Get observation code and display
-                        if "code" in resource and "coding" in resource["code"]:
-                            coding = resource["code"]["coding"][0]
-                            observation["code"] = coding.get("code", "")
-                            observation["display"] = coding.get("display", "")
-                        
-                        # Get value
-                        if "valueQuantity" in resource:
-                            value_qty = resource["valueQuantity"]
-                            observation["value"] = str(value_qty.get("value", ""))
-                            observation["unit"] = value_qty.get("unit", "")
-                        elif "valueString" in resource:
-                            observation["value"] = resource["valueString"]
-                        
-                        # Get reference range
-                        if "referenceRange" in resource and resource["referenceRange"]:
-                            ref_range = resource["referenceRange"][0]
-                            if "text" in ref_range:
-                                observation["reference_range"] = ref_range["text"]
-                        
-                        # Get interpretation
-                        if "interpretation" in resource and resource["interpretation"]:
-                            if "coding" in resource["interpretation"][0]:
-                                interp_coding = resource["interpretation"][0]["coding"][0]
-                                observation["interpretation"] = interp_coding.get("display", "")
-                        
-                        result["observations"].append(observation)
+                    handler = _RESOURCE_HANDLERS.get(resource.get("resourceType", ""))
+                    if handler:
+                        handler(resource, result)
             
             return result
             
@@ -136,13 +167,19 @@ class FHIRSummaryTools:
             
             patient_name = patient_info.get("name", "Patient")
             
-            # Extract major diagnoses (active conditions)
+            # Extract major diagnoses (active conditions) and medications
+            # (medication-related conditions) in one pass over the conditions
             major_diagnoses = []
+            medications = []
             for condition in conditions:
-                if condition.get("status", "").lower() == "active" or condition.get("severity") in ["Severe", "Moderate"]:
-                    diagnosis = condition.get("display", "")
-                    if diagnosis:
-                        major_diagnoses.append(diagnosis)
+                display = condition.get("display", "")
+                if display and (
+                    condition.get("status", "").lower() == "active"
+                    or condition.get("severity") in _MAJOR_SEVERITIES
+                ):
+                    major_diagnoses.append(display)
+                if _TREATMENT_RE.search(display):
+                    medications.append(display)
             
             # If no major diagnoses, take the first few conditions
             if not major_diagnoses:
@@ -157,8 +194,8 @@ class FHIRSummaryTools:
                 interpretation = obs.get("interpretation", "")
                 
                 # Include tests with abnormal interpretations or specific important tests
-                if (interpretation and interpretation.lower() not in ["normal", ""]) or \
-                   any(keyword in display.lower() for keyword in ["glucose", "cholesterol", "hemoglobin", "creatinine", "bnp", "troponin"]):
+                if (interpretation and interpretation.lower() not in _NORMAL_INTERPRETATIONS) or \
+                   _KEY_LAB_TEST_RE.search(display):
                     test_info = display
                     if value and unit:
                         test_info += f" ({value} {unit})"
@@ -166,13 +203,6 @@ class FHIRSummaryTools:
                         test_info += f" - {interpretation}"
                     key_lab_tests.append(test_info)
             
-            # Extract medications (look for medication-related conditions or observations)
-            medications = []
-            for condition in conditions:
-                condition_text = condition.get("display", "").lower()
-                if any(med_keyword in condition_text for med_keyword in ["medication", "therapy", "treatment"]):
-                    medications.append(condition.get("display", ""))
-            
             # Build summary
             summary_parts = []
             
@@ -231,8 +261,12 @@ class FHIRSummaryTools:
         if not fhir_json_data or not fhir_json_data.strip():
             return "Error: Please provide FHIR JSON data."
 
-        fhir_content = fhir_json_data.strip()
+        return FHIRSummaryTools._summary_for(fhir_json_data.strip())
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _summary_for(fhir_content: str) -> str:
+        """Generate the summary for FHIR JSON content; cached, as the output only depends on the content"""
         # Parse FHIR data
         parsed_data = FHIRSummaryTools._parse_fhir_data(fhir_content)
         
@@ -261,8 +295,12 @@ class FHIRSummaryTools:
         if not fhir_json_data or not fhir_json_data.strip():
             return "Error: Please provide FHIR JSON data."
 
-        fhir_content = fhir_json_data.strip()
+        return FHIRSummaryTools._analysis_for(fhir_json_data.strip())
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _analysis_for(fhir_content: str) -> str:
+        """Format the analysis for FHIR JSON content; cached, as the output only depends on the content"""
         # Parse FHIR data
         parsed_data = FHIRSummaryTools._parse_fhir_data(fhir_content)
         
@@ -316,6 +354,7 @@ class FHIRSummaryTools:
         return "\n".join(result)
 
     @classmethod
+    @functools.cache
     def get_all_kernel_functions(cls) -> dict[str, Callable]:
         """
         Returns a dictionary of all methods in this class that have the @kernel_function annotation.
@@ -327,7 +366,7 @@ class FHIRSummaryTools:
         kernel_functions = {}
 
         # Get all class methods
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private/special methods
             if name.startswith("_") or name == "get_all_kernel_functions":
                 continue
@@ -339,6 +378,42 @@ class FHIRSummaryTools:
         return kernel_functions
 
     @classmethod
+    def iter_kernel_functions(cls) -> Iterator[Callable]:
+        """
+        Yields every method in this class that has the @kernel_function annotation,
+        without building the name-keyed dictionary returned by get_all_kernel_functions.
+
+        Returns:
+            Iterator[Callable]: The kernel function objects
+        """
+        for name, method in iter_functions(cls):
+            # Skip private/special methods
+            if name.startswith("_"):
+                continue
+
+            if hasattr(method, "__kernel_function__"):
+                yield method
+
+    @classmethod
+    def get_tool_metadata(cls) -> list[tuple[str, str]]:
+        """
+        Returns the name and description of every @kernel_function in this class.
+        Reads the class namespace only, without signature or type-hint introspection.
+
+        Returns:
+            list[tuple[str, str]]: (function name, description) pairs
+        """
+        metadata = []
+
+        for name, method in iter_functions(cls):
+            if name.startswith("_") or not hasattr(method, "__kernel_function__"):
+                continue
+            metadata.append((name, getattr(method, "__kernel_function_description__", None) or ""))
+
+        return metadata
+
+    @classmethod
+    @functools.cache
     def generate_tools_json_doc(cls) -> str:
         """
         Generate a JSON document containing information about all methods in the class.
@@ -350,7 +425,7 @@ class FHIRSummaryTools:
         tools_list = []
 
         # Get all methods from the class that have the kernel_function annotation
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private methods
             if name.startswith("_") or name == "generate_tools_json_doc":
                 continue
@@ -411,4 +486,20 @@ class FHIRSummaryTools:
                 tools_list.append(tool_entry)
 
         # Return the JSON string representation
-        return json.dumps(tools_list, ensure_ascii=False)
\ No newline at end of file
+        return json.dumps(tools_list, ensure_ascii=False)
+
+
+def _precompute_patient_results() -> None:
+    """Fill the summary and analysis caches for the bundled patient files"""
+    for patient_id in _patient_files.FILE_MAPPING:
+        try:
+            fhir_content = _patient_files.load(patient_id).strip()
+            FHIRSummaryTools._summary_for(fhir_content)
+            FHIRSummaryTools._analysis_for(fhir_content)
+        except Exception as e:
+            # Worked out on first use instead; importing the tools must not fail
+            logger.debug("Skipping precomputed results for %s: %s", patient_id, e)
+
+
+# The Patient agent hands these bundles on verbatim, so their results are worked out once at import
+_precompute_patient_results()
@@ -1,8 +1,10 @@
+import functools
 import inspect
 from typing import Callable
 
 from semantic_kernel.functions import kernel_function
 from models.messages_kernel import AgentType
+from kernel_tools._introspection import iter_functions
 import json
 from typing import get_type_hints
 
@@ -23,6 +25,7 @@ class GenericTools:
         return "This is a placeholder function"
 
     @classmethod
+    @functools.cache
     def get_all_kernel_functions(cls) -> dict[str, Callable]:
         """
         Returns a dictionary of all methods in this class that have the @kernel_function annotation.
@@ -34,7 +37,7 @@ class GenericTools:
         kernel_functions = {}
 
         # Get all class methods
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private/special methods
             if name.startswith("_") or name == "get_all_kernel_functions":
                 continue
@@ -50,6 +53,7 @@ class GenericTools:
         return kernel_functions
 
     @classmethod
+    @functools.cache
     def generate_tools_json_doc(cls) -> str:
         """
         Generate a JSON document containing information about all methods in the class.
@@ -61,7 +65,7 @@ class GenericTools:
         tools_list = []
 
         # Get all methods from the class that have the kernel_function annotation
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private methods
             if name.startswith("_") or name == "generate_tools_json_doc":
                 continue
@@ -1,10 +1,20 @@
+import difflib
+import functools
 import inspect
 import json
-import os
-from typing import Callable, get_type_hints
+from typing import Callable, Iterator, Optional, get_type_hints
 
 from semantic_kernel.functions import kernel_function
 from models.messages_kernel import AgentType
+from kernel_tools import _patient_files
+from kernel_tools._introspection import iter_functions
+from kernel_tools._patient_files import PatientLookupError
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase a patient name and collapse its whitespace for lookups."""
+    return " ".join(name.lower().split())
+
 
 class PatientTools:
     """Define Patient Agent functions (tools) for patient lookup by name"""
@@ -12,34 +22,53 @@ class PatientTools:
     agent_name = AgentType.PATIENT.value
 
     # File mapping - maps patient IDs to JSON files
-    FILE_MAPPING = {
-        "patient-p01": {"name": "Robert James Henderson", "file": "p01-heart.json"},
-        "patient-p02": {"name": "Linda Marie Williams", "file": "p02-lungs.json"},
-        "patient-p03": {"name": "Alex Jordan Thompson", "file": "p03-healthy.json"}
-    }
+    FILE_MAPPING = _patient_files.FILE_MAPPING
+
+    # Normalized patient name -> patient ID, built once at import
+    _NAME_INDEX = {_normalize_name(info["name"]): pid for pid, info in FILE_MAPPING.items()}
+    # Normalized patient name -> full patient name, for suggestions
+    _FULL_NAMES = {_normalize_name(info["name"]): info["name"] for info in FILE_MAPPING.values()}
+    # (name tokens, full patient name) pairs for partial-name suggestions
+    _NAME_TOKENS = tuple((frozenset(name.split()), full_name) for name, full_name in _FULL_NAMES.items())
+    # Listed in the not-found error message
+    _AVAILABLE_NAMES = ", ".join(
+        info.get("name") for info in FILE_MAPPING.values() if isinstance(info, dict) and info.get("name")
+    )
 
     @staticmethod
-    def _load_patient_file(patient_id: str) -> str:
-        """Load patient file content by ID"""
-        try:
-            filename = PatientTools.FILE_MAPPING.get(patient_id)
-            if not filename:
-                return f"Error: No file mapping found for patient ID: {patient_id}"
+    async def _load_patient_file(patient_id: str) -> str:
+        """Load patient file content by ID, raising PatientLookupError on failure"""
+        return await _patient_files.load_async(patient_id)
 
-            # Construct file path relative to the backend directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            backend_dir = os.path.dirname(current_dir)
-            file_path = os.path.join(backend_dir, "data", "patients", filename["file"])
-
-            if not os.path.exists(file_path):
-                return f"Error: Patient file not found: {file_path}"
+    @staticmethod
+    def _match_patient_id(patient_name: str) -> Optional[str]:
+        """Resolve a patient name to its ID by exact (case-insensitive) match, or None"""
+        return PatientTools._NAME_INDEX.get(_normalize_name(patient_name))
 
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                return content
+    @staticmethod
+    def _suggest_names(patient_name: str) -> list[str]:
+        """Full names close to an unmatched name; offered for confirmation, never used for a lookup"""
+        query = _normalize_name(patient_name)
+
+        # Names containing every word of the query ("Robert Henderson"), then
+        # close spellings ("Robert Jmes Henderson")
+        query_tokens = frozenset(query.split())
+        suggestions = [
+            full_name for name_tokens, full_name in PatientTools._NAME_TOKENS
+            if query_tokens <= name_tokens
+        ]
+        for close in difflib.get_close_matches(query, PatientTools._FULL_NAMES, n=3, cutoff=0.85):
+            if PatientTools._FULL_NAMES[close] not in suggestions:
+                suggestions.append(PatientTools._FULL_NAMES[close])
+
+        return suggestions
 
-        except Exception as e:
-            return f"Error loading patient file: {str(e)}"
+    @staticmethod
+    def _name_not_found(patient_name: str) -> str:
+        """Error message for a name that matches no known patient"""
+        suggestions = PatientTools._suggest_names(patient_name)
+        hint = f" Did you mean: {', '.join(suggestions)}? Confirm the name with the user." if suggestions else ""
+        return f"Error: Patient name '{patient_name}' not found.{hint} Available names: {PatientTools._AVAILABLE_NAMES}"
 
     @staticmethod
     @kernel_function(
@@ -69,31 +98,58 @@ class PatientTools:
         if not patient_name or not patient_name.strip():
             return "Error: Please provide a patient name."
 
-        query = patient_name.strip().lower()
-
-        # Find the patient id by matching the provided name (case-insensitive)
-        matched_id = None
-        for pid, info in PatientTools.FILE_MAPPING.items():
-            if isinstance(info, dict):
-                name = info.get("name", "")
-                if isinstance(name, str) and name.strip().lower() == query:
-                    matched_id = pid
-                    break
-
+        matched_id = PatientTools._match_patient_id(patient_name)
         if not matched_id:
-            available_names = [v.get("name") for v in PatientTools.FILE_MAPPING.values() if isinstance(v, dict) and v.get("name")]
-            available_str = ", ".join(available_names)
-            return f"Error: Patient name '{patient_name}' not found. Available names: {available_str}"
+            return PatientTools._name_not_found(patient_name)
 
         # Load and return the patient file content using the matched id
-        patient_content = PatientTools._load_patient_file(matched_id)
+        try:
+            return await PatientTools._load_patient_file(matched_id)
+        except PatientLookupError as e:
+            return str(e)
 
-        if isinstance(patient_content, str) and patient_content.startswith("Error:"):
-            return patient_content
+    @staticmethod
+    @kernel_function(
+        description="Get patient data for several patients in one call. Pass patient full names separated by commas"
+    )
+    async def get_patients_by_names(patient_names: str) -> str:
+        """
+        Get patient data for several patients by full name in a single call.
+
+        Args:
+            patient_names: Comma-separated patient full names (e.g., 'Robert James Henderson, Linda Marie Williams')
 
-        return patient_content
+        Returns:
+            JSON object mapping each requested name to its FHIR JSON content, or to an error message.
+            Names resolving to a patient already in the result map to a reference to that entry.
+        """
+        names = dict.fromkeys(name.strip() for name in (patient_names or "").split(","))
+        names.pop("", None)
+        if not names:
+            return "Error: Please provide at least one patient name."
+
+        results = {}
+        first_names = {}  # Patient ID -> first requested name resolving to it
+        for name in names:
+            matched_id = PatientTools._match_patient_id(name)
+            if not matched_id:
+                results[name] = PatientTools._name_not_found(name)
+            elif matched_id in first_names:
+                # Each patient's data is included once, however many names resolve to it
+                results[name] = f"Same patient as '{first_names[matched_id]}' ({matched_id})"
+            else:
+                first_names[matched_id] = name
+                try:
+                    results[name] = json.loads(await PatientTools._load_patient_file(matched_id))
+                except PatientLookupError as e:
+                    results[name] = str(e)
+                except json.JSONDecodeError as e:
+                    results[name] = f"Error: Patient file for {matched_id} is not valid JSON: {str(e)}"
+
+        return json.dumps(results, ensure_ascii=False)
 
     @classmethod
+    @functools.cache
     def get_all_kernel_functions(cls) -> dict[str, Callable]:
         """
         Returns a dictionary of all methods in this class that have the @kernel_function annotation.
@@ -105,7 +161,7 @@ class PatientTools:
         kernel_functions = {}
 
         # Get all class methods
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private/special methods
             if name.startswith("_") or name == "get_all_kernel_functions":
                 continue
@@ -117,6 +173,42 @@ class PatientTools:
         return kernel_functions
 
     @classmethod
+    def iter_kernel_functions(cls) -> Iterator[Callable]:
+        """
+        Yields every method in this class that has the @kernel_function annotation,
+        without building the name-keyed dictionary returned by get_all_kernel_functions.
+
+        Returns:
+            Iterator[Callable]: The kernel function objects
+        """
+        for name, method in iter_functions(cls):
+            # Skip private/special methods
+            if name.startswith("_"):
+                continue
+
+            if hasattr(method, "__kernel_function__"):
+                yield method
+
+    @classmethod
+    def get_tool_metadata(cls) -> list[tuple[str, str]]:
+        """
+        Returns the name and description of every @kernel_function in this class.
+        Reads the class namespace only, without signature or type-hint introspection.
+
+        Returns:
+            list[tuple[str, str]]: (function name, description) pairs
+        """
+        metadata = []
+
+        for name, method in iter_functions(cls):
+            if name.startswith("_") or not hasattr(method, "__kernel_function__"):
+                continue
+            metadata.append((name, getattr(method, "__kernel_function_description__", None) or ""))
+
+        return metadata
+
+    @classmethod
+    @functools.cache
     def generate_tools_json_doc(cls) -> str:
         """
         Generate a JSON document containing information about all methods in the class.
@@ -128,7 +220,7 @@ class PatientTools:
         tools_list = []
 
         # Get all methods from the class that have the kernel_function annotation
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private methods
             if name.startswith("_") or name == "generate_tools_json_doc":
                 continue
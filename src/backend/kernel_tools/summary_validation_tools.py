@@ -1,39 +1,105 @@
 """Summary Validation Tools for validating medical summaries."""
 
+import functools
 import inspect
 import json
 import logging
-from typing import Callable, Dict, Any, get_type_hints
+import re
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Callable, Dict, Any, Iterator, Optional, Tuple, get_type_hints
 from semantic_kernel.functions import kernel_function
+from kernel_tools._introspection import iter_functions
+
+logger = logging.getLogger(__name__)
+
+# Summary fields and raw-text patterns accepted for each required field
+_NAME_KEYS = frozenset({"patient_name", "name", "full_name", "patient_demographics"})
+_NAME_PATTERNS = ("patient:", "name:", "patient name:", "full name:")
+_AGE_KEYS = frozenset({"age", "patient_age", "birth_date", "date_of_birth", "birthDate"})
+_AGE_PATTERNS = ("age:", "years old", "y/o", "born", "age ")
+_EVENT_KEYS = frozenset({
+    "medical_events", "recent_medical_events", "conditions",
+    "medical_conditions", "diagnoses", "procedures",
+})
+_EVENT_PATTERNS = (
+    "diagnosis:", "condition:", "procedure:", "treatment:", "medical history:", "recent events:",
+)
+
+
+def _compile_patterns(patterns: tuple) -> re.Pattern:
+    """Compile literal substrings into a single alternation matched against lowercased text."""
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+_NAME_RE = _compile_patterns(_NAME_PATTERNS)
+_AGE_RE = _compile_patterns(_AGE_PATTERNS)
+_EVENT_RE = _compile_patterns(_EVENT_PATTERNS)
+
+# Sections expected in a medical summary; the lookahead finds every occurrence,
+# including ones that overlap, so a single findall sees all sections present
+_EXPECTED_SECTIONS = ('patient', 'age', 'medical', 'condition', 'diagnosis', 'treatment')
+_SECTIONS_RE = re.compile(f"(?=({'|'.join(_EXPECTED_SECTIONS)}))")
+
+
+class _SummaryField(IntFlag):
+    """Required summary fields, combined into the set found by the completeness check."""
+
+    NAME = 1
+    AGE = 2
+    MEDICAL_EVENTS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedSummary:
+    """A summary parsed once and shared by the completeness and format checks."""
+
+    json_dict: Optional[Dict[str, Any]]  # Parsed summary, if it is a JSON object
+    json_error: Optional[json.JSONDecodeError]  # Set if the summary looks like JSON but does not parse
+    stripped_length: int
+    text_lower: str
+
+
+def _parse_summary(summary_data: str) -> _ParsedSummary:
+    """Parse summary_data as JSON if it looks like an object, and lowercase it for text scans."""
+    stripped = summary_data.strip()
+    json_dict = json_error = None
+    if stripped.startswith('{'):
+        try:
+            json_dict = json.loads(summary_data)
+        except json.JSONDecodeError as e:
+            json_error = e
+    return _ParsedSummary(json_dict, json_error, len(stripped), summary_data.lower())
+
+
+def _has_any_field(summary_dict: Dict[str, Any], keys: frozenset) -> bool:
+    """Return True if summary_dict has a non-empty value under any of keys."""
+    if keys.isdisjoint(summary_dict):
+        return False
+    return any(summary_dict[key] for key in keys.intersection(summary_dict))
 
 
 class SummaryValidationTools:
     """Tools for validating medical summaries to ensure they contain required fields."""
 
     @staticmethod
-    @kernel_function(
-        description="Validate that a medical summary contains all three required fields: patient name, age, and recent medical events."
-    )
-    async def validate_summary_completeness(summary_data: str) -> str:
-        """
-        Validate that a medical summary contains the three essential fields.
-        
-        Args:
-            summary_data: JSON string or text containing the medical summary to validate
-            
-        Returns:
-            JSON string with validation results including missing fields and recommendations
-        """
+    def _validate_completeness_dict(
+        summary_data: str, parsed: Optional[_ParsedSummary] = None
+    ) -> Tuple[Dict[str, Any], _SummaryField]:
+        """Check the three required summary fields, returning the validation result and the fields found."""
+        present = _SummaryField(0)
         try:
-            # Parse summary data if it's JSON
-            if summary_data.strip().startswith('{'):
-                try:
-                    summary_dict = json.loads(summary_data)
-                except json.JSONDecodeError:
-                    summary_dict = {"raw_text": summary_data}
-            else:
+            if parsed is None:
+                parsed = _parse_summary(summary_data)
+
+            # Use the parsed JSON if there is one, otherwise scan the raw text
+            if parsed.json_dict is None:
                 summary_dict = {"raw_text": summary_data}
-            
+                text = parsed.text_lower
+            else:
+                summary_dict = parsed.json_dict
+                text = summary_dict['raw_text'].lower() if 'raw_text' in summary_dict else None
+
             validation_result = {
                 "is_valid": True,
                 "missing_fields": [],
@@ -42,17 +108,15 @@ class SummaryValidationTools:
             }
             
             # Check for patient name
-            name_fields = ['patient_name', 'name', 'full_name', 'patient_demographics']
-            name_found = any(field in summary_dict and summary_dict[field] for field in name_fields)
+            name_found = _has_any_field(summary_dict, _NAME_KEYS)
             
             if not name_found:
                 # Also check in raw text for name patterns
-                if 'raw_text' in summary_dict:
-                    text = summary_dict['raw_text'].lower()
-                    name_patterns = ['patient:', 'name:', 'patient name:', 'full name:']
-                    name_found = any(pattern in text for pattern in name_patterns)
+                if text is not None:
+                    name_found = _NAME_RE.search(text) is not None
             
             if name_found:
+                present |= _SummaryField.NAME
                 validation_result["present_fields"].append("✅ Patient Name")
             else:
                 validation_result["is_valid"] = False
@@ -62,17 +126,15 @@ class SummaryValidationTools:
                 )
             
             # Check for patient age
-            age_fields = ['age', 'patient_age', 'birth_date', 'date_of_birth', 'birthDate']
-            age_found = any(field in summary_dict and summary_dict[field] for field in age_fields)
+            age_found = _has_any_field(summary_dict, _AGE_KEYS)
             
             if not age_found:
                 # Also check in raw text for age patterns
-                if 'raw_text' in summary_dict:
-                    text = summary_dict['raw_text'].lower()
-                    age_patterns = ['age:', 'years old', 'y/o', 'born', 'age ']
-                    age_found = any(pattern in text for pattern in age_patterns)
+                if text is not None:
+                    age_found = _AGE_RE.search(text) is not None
             
             if age_found:
+                present |= _SummaryField.AGE
                 validation_result["present_fields"].append("✅ Patient Age")
             else:
                 validation_result["is_valid"] = False
@@ -82,17 +144,15 @@ class SummaryValidationTools:
                 )
             
             # Check for recent medical events
-            medical_fields = ['medical_events', 'recent_medical_events', 'conditions', 'medical_conditions', 'diagnoses', 'procedures']
-            medical_found = any(field in summary_dict and summary_dict[field] for field in medical_fields)
+            medical_found = _has_any_field(summary_dict, _EVENT_KEYS)
             
             if not medical_found:
                 # Also check in raw text for medical event patterns
-                if 'raw_text' in summary_dict:
-                    text = summary_dict['raw_text'].lower()
-                    medical_patterns = ['diagnosis:', 'condition:', 'procedure:', 'treatment:', 'medical history:', 'recent events:']
-                    medical_found = any(pattern in text for pattern in medical_patterns)
+                if text is not None:
+                    medical_found = _EVENT_RE.search(text) is not None
             
             if medical_found:
+                present |= _SummaryField.MEDICAL_EVENTS
                 validation_result["present_fields"].append("✅ Recent Medical Events")
             else:
                 validation_result["is_valid"] = False
@@ -101,33 +161,42 @@ class SummaryValidationTools:
                     "Add recent medical events in fields like 'medical_events', 'conditions', or 'diagnoses'"
                 )
             
-            return json.dumps(validation_result, indent=2)
+            return validation_result, present
             
         except Exception as e:
-            logging.error(f"Error validating summary: {e}")
-            return json.dumps({
+            logger.error("Error validating summary: %s", e)
+            return {
                 "is_valid": False,
                 "error": f"Validation failed: {str(e)}",
                 "missing_fields": ["❌ Validation Error"],
                 "present_fields": [],
                 "recommendations": ["Please check the summary format and try again"]
-            })
+            }, _SummaryField(0)
 
     @staticmethod
     @kernel_function(
-        description="Check if a medical summary follows the expected data patterns found in patient files."
+        description="Validate that a medical summary contains all three required fields: patient name, age, and recent medical events."
     )
-    async def validate_summary_format(summary_data: str) -> str:
+    async def validate_summary_completeness(summary_data: str) -> str:
         """
-        Validate the format and structure of a medical summary.
+        Validate that a medical summary contains the three essential fields.
         
         Args:
-            summary_data: JSON string or text containing the medical summary
+            summary_data: JSON string or text containing the medical summary to validate
             
         Returns:
-            JSON string with format validation results
+            JSON string with validation results including missing fields and recommendations
         """
+        validation_result, _ = SummaryValidationTools._validate_completeness_dict(summary_data)
+        return json.dumps(validation_result, indent=2)
+
+    @staticmethod
+    def _validate_format_dict(summary_data: str, parsed: Optional[_ParsedSummary] = None) -> Dict[str, Any]:
+        """Check the summary's format and structure, returning the validation result as a dict."""
         try:
+            if parsed is None:
+                parsed = _parse_summary(summary_data)
+
             validation_result = {
                 "format_valid": True,
                 "format_issues": [],
@@ -135,25 +204,21 @@ class SummaryValidationTools:
             }
             
             # Check if it's valid JSON
-            if summary_data.strip().startswith('{'):
-                try:
-                    json.loads(summary_data)
-                    validation_result["suggestions"].append("✅ Valid JSON format")
-                except json.JSONDecodeError as e:
-                    validation_result["format_valid"] = False
-                    validation_result["format_issues"].append(f"❌ Invalid JSON: {str(e)}")
-                    validation_result["suggestions"].append("Ensure the summary is in valid JSON format")
+            if parsed.json_dict is not None:
+                validation_result["suggestions"].append("✅ Valid JSON format")
+            elif parsed.json_error is not None:
+                validation_result["format_valid"] = False
+                validation_result["format_issues"].append(f"❌ Invalid JSON: {str(parsed.json_error)}")
+                validation_result["suggestions"].append("Ensure the summary is in valid JSON format")
             
             # Check for empty or minimal content
-            if len(summary_data.strip()) < 50:
+            if parsed.stripped_length < 50:
                 validation_result["format_valid"] = False
                 validation_result["format_issues"].append("❌ Summary too short")
                 validation_result["suggestions"].append("Summary should contain meaningful patient information")
             
             # Check for common medical summary structure
-            text_lower = summary_data.lower()
-            expected_sections = ['patient', 'age', 'medical', 'condition', 'diagnosis', 'treatment']
-            found_sections = [section for section in expected_sections if section in text_lower]
+            found_sections = set(_SECTIONS_RE.findall(parsed.text_lower))
             
             if len(found_sections) < 3:
                 validation_result["format_issues"].append("❌ Missing expected medical content sections")
@@ -161,15 +226,31 @@ class SummaryValidationTools:
             else:
                 validation_result["suggestions"].append(f"✅ Found {len(found_sections)} relevant medical sections")
             
-            return json.dumps(validation_result, indent=2)
+            return validation_result
             
         except Exception as e:
-            logging.error(f"Error validating format: {e}")
-            return json.dumps({
+            logger.error("Error validating format: %s", e)
+            return {
                 "format_valid": False,
                 "format_issues": [f"❌ Format validation error: {str(e)}"],
                 "suggestions": ["Please check the summary format and try again"]
-            })
+            }
+
+    @staticmethod
+    @kernel_function(
+        description="Check if a medical summary follows the expected data patterns found in patient files."
+    )
+    async def validate_summary_format(summary_data: str) -> str:
+        """
+        Validate the format and structure of a medical summary.
+        
+        Args:
+            summary_data: JSON string or text containing the medical summary
+            
+        Returns:
+            JSON string with format validation results
+        """
+        return json.dumps(SummaryValidationTools._validate_format_dict(summary_data), indent=2)
 
     @staticmethod
     @kernel_function(
@@ -186,13 +267,10 @@ class SummaryValidationTools:
             Detailed validation report in JSON format
         """
         try:
-            # Get completeness validation
-            completeness_result = await SummaryValidationTools.validate_summary_completeness(summary_data)
-            completeness_data = json.loads(completeness_result)
-            
-            # Get format validation
-            format_result = await SummaryValidationTools.validate_summary_format(summary_data)
-            format_data = json.loads(format_result)
+            # Parse the summary once for both checks; their results are serialized as part of the report
+            parsed = _parse_summary(summary_data)
+            completeness_data, present = SummaryValidationTools._validate_completeness_dict(summary_data, parsed)
+            format_data = SummaryValidationTools._validate_format_dict(summary_data, parsed)
             
             # Generate comprehensive report
             report = {
@@ -201,9 +279,9 @@ class SummaryValidationTools:
                     "completeness_check": completeness_data,
                     "format_check": format_data,
                     "required_fields_status": {
-                        "patient_name": "✅ Present" if "✅ Patient Name" in completeness_data.get("present_fields", []) else "❌ Missing",
-                        "patient_age": "✅ Present" if "✅ Patient Age" in completeness_data.get("present_fields", []) else "❌ Missing",
-                        "recent_medical_events": "✅ Present" if "✅ Recent Medical Events" in completeness_data.get("present_fields", []) else "❌ Missing"
+                        "patient_name": "✅ Present" if present & _SummaryField.NAME else "❌ Missing",
+                        "patient_age": "✅ Present" if present & _SummaryField.AGE else "❌ Missing",
+                        "recent_medical_events": "✅ Present" if present & _SummaryField.MEDICAL_EVENTS else "❌ Missing"
                     },
                     "recommendations": completeness_data.get("recommendations", []) + format_data.get("suggestions", [])
                 }
@@ -212,7 +290,7 @@ class SummaryValidationTools:
             return json.dumps(report, indent=2)
             
         except Exception as e:
-            logging.error(f"Error generating validation report: {e}")
+            logger.error("Error generating validation report: %s", e)
             return json.dumps({
                 "summary_validation_report": {
                     "overall_status": "ERROR",
@@ -222,6 +300,7 @@ class SummaryValidationTools:
             })
 
     @classmethod
+    @functools.cache
     def get_all_kernel_functions(cls) -> Dict[str, Callable]:
         """
         Returns a dictionary of all methods in this class that have the @kernel_function annotation.
@@ -232,7 +311,7 @@ class SummaryValidationTools:
         kernel_functions = {}
         
         # Get all class methods
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private/special methods
             if name.startswith("_") or name == "get_all_kernel_functions":
                 continue
@@ -244,6 +323,42 @@ class SummaryValidationTools:
         return kernel_functions
 
     @classmethod
+    def iter_kernel_functions(cls) -> Iterator[Callable]:
+        """
+        Yields every method in this class that has the @kernel_function annotation,
+        without building the name-keyed dictionary returned by get_all_kernel_functions.
+
+        Returns:
+            Iterator[Callable]: The kernel function objects
+        """
+        for name, method in iter_functions(cls):
+            # Skip private/special methods
+            if name.startswith("_"):
+                continue
+
+            if hasattr(method, "__kernel_function__"):
+                yield method
+
+    @classmethod
+    def get_tool_metadata(cls) -> list[tuple[str, str]]:
+        """
+        Returns the name and description of every @kernel_function in this class.
+        Reads the class namespace only, without signature or type-hint introspection.
+
+        Returns:
+            list[tuple[str, str]]: (function name, description) pairs
+        """
+        metadata = []
+
+        for name, method in iter_functions(cls):
+            if name.startswith("_") or not hasattr(method, "__kernel_function__"):
+                continue
+            metadata.append((name, getattr(method, "__kernel_function_description__", None) or ""))
+
+        return metadata
+
+    @classmethod
+    @functools.cache
     def generate_tools_json_doc(cls) -> str:
         """
         Generate a JSON document containing information about all methods in the class.
@@ -255,7 +370,7 @@ class SummaryValidationTools:
         tools_list = []
 
         # Get all methods from the class that have the kernel_function annotation
-        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        for name, method in iter_functions(cls):
             # Skip this method itself and any private methods
             if name.startswith("_") or name == "generate_tools_json_doc":
                 continue
@@ -0,0 +1,203 @@
+# src/backend/tests/agents/test_agent_definition_pool.py
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+HERE = os.path.dirname(__file__)
+SRC_BACKEND = os.path.abspath(os.path.join(HERE, "..", ".."))
+if SRC_BACKEND not in sys.path:
+    sys.path.insert(0, SRC_BACKEND)
+
+import pytest
+
+# Environment app_config needs to construct at import time
+MOCK_ENV_VARS = {
+    "AZURE_OPENAI_ENDPOINT": "https://mock-openai-endpoint.azure.com/",
+    "AZURE_AI_SUBSCRIPTION_ID": "00000000-0000-0000-0000-000000000000",
+    "AZURE_AI_RESOURCE_GROUP": "rg-test",
+    "AZURE_AI_PROJECT_NAME": "proj-test",
+    "AZURE_AI_AGENT_ENDPOINT": "https://agents.example.com/",
+}
+
+# Modules other test modules replace with stubs at import time
+STUBBED_MODULES = (
+    "app_config", "context", "context.cosmos_memory_kernel",
+    "helpers", "helpers.azure_credential_utils", "models", "models.messages_kernel",
+)
+
+# Evict any stub of models.messages_kernel left by other test modules
+sys.modules.pop("models.messages_kernel", None)
+sys.modules.pop("models", None)
+preloaded = {name for name in STUBBED_MODULES if name in sys.modules}
+
+with patch.dict(os.environ, MOCK_ENV_VARS, clear=False):
+    from kernel_agents.agent_base import AgentDefinitionPool
+
+# Unload the real modules again, so modules collected later still install their stubs
+for name in STUBBED_MODULES:
+    if name not in preloaded:
+        sys.modules.pop(name, None)
+
+
+class CountingFactory:
+    """Batch factory recording the keys it is asked to create."""
+
+    def __init__(self, release=None):
+        self.calls = []
+        self.release = release
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        if self.release is not None:
+            await self.release.wait()
+        return [f"definition-{key}-{len(self.calls)}" for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_creator_does_not_cancel_waiters():
+    pool = AgentDefinitionPool()
+    release = asyncio.Event()
+    factory = CountingFactory(release)
+
+    creator = asyncio.create_task(pool.get_or_create_many(["c"], factory))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(pool.get_or_create_many(["c"], factory))
+    await asyncio.sleep(0)
+
+    creator.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await creator
+
+    # The waiter creates the definition itself instead of inheriting the cancellation
+    release.set()
+    assert await waiter == ["definition-c-2"]
+    assert factory.calls == [["c"], ["c"]]
+
+
+class FailingFactory(CountingFactory):
+    """Batch factory that fails on the calls listed in fail_on (1-based)."""
+
+    def __init__(self, fail_on, release=None):
+        super().__init__(release)
+        self.fail_on = fail_on
+
+    async def __call__(self, keys):
+        definitions = await super().__call__(keys)
+        if len(self.calls) in self.fail_on:
+            raise RuntimeError("agents endpoint unavailable")
+        return definitions
+
+
+async def wait_for_refreshes(pool):
+    await asyncio.gather(*list(pool._refresh_tasks))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_factory_call():
+    pool = AgentDefinitionPool()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return "definition"
+
+    results = await asyncio.gather(*(pool.get_or_create("a", factory) for _ in range(5)))
+    assert results == ["definition"] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_waiters_and_is_not_pooled():
+    pool = AgentDefinitionPool()
+    release = asyncio.Event()
+    factory = FailingFactory(fail_on={1}, release=release)
+
+    creator = asyncio.create_task(pool.get_or_create_many(["a"], factory))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(pool.get_or_create_many(["a"], factory))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (creator, waiter):
+        with pytest.raises(RuntimeError, match="agents endpoint unavailable"):
+            await task
+    assert factory.calls == [["a"]]
+
+    # The failure is not cached; the next caller creates the definition again
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-2"]
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_skips_factory():
+    pool = AgentDefinitionPool()
+    factory = CountingFactory()
+
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-1"]
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-1"]
+    assert factory.calls == [["a"]]
+    assert not pool._refresh_tasks
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_is_served_while_refreshing():
+    pool = AgentDefinitionPool(fresh_ttl=0.0)
+    factory = CountingFactory()
+
+    await pool.get_or_create_many(["a"], factory)
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-1"]
+
+    await wait_for_refreshes(pool)
+    assert factory.calls == [["a"], ["a"]]
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-2"]
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_fetched_again():
+    pool = AgentDefinitionPool(stale_ttl=0.0)
+    factory = CountingFactory()
+
+    await pool.get_or_create_many(["a"], factory)
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-2"]
+    assert factory.calls == [["a"], ["a"]]
+    assert not pool._refresh_tasks
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_old_definition():
+    pool = AgentDefinitionPool(fresh_ttl=0.0)
+    factory = FailingFactory(fail_on={2})
+
+    await pool.get_or_create_many(["a"], factory)
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-1"]
+    await wait_for_refreshes(pool)
+
+    assert factory.calls == [["a"], ["a"]]
+    assert await pool.get_or_create_many(["a"], factory) == ["definition-a-1"]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted_at_maxsize():
+    pool = AgentDefinitionPool(maxsize=2)
+    factory = CountingFactory()
+
+    await pool.get_or_create_many(["a"], factory)
+    await pool.get_or_create_many(["b"], factory)
+    await pool.get_or_create_many(["a"], factory)  # a is now more recently used than b
+    await pool.get_or_create_many(["c"], factory)
+
+    assert list(pool._definitions) == ["a", "c"]
+    assert await pool.get_or_create_many(["b"], factory) == ["definition-b-4"]
+    assert factory.calls == [["a"], ["b"], ["c"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_with_duplicate_keys():
+    pool = AgentDefinitionPool()
+    factory = CountingFactory()
+
+    results = await pool.get_or_create_many(["a", "b", "a"], factory)
+    assert results == ["definition-a-1", "definition-b-1", "definition-a-1"]
+    assert factory.calls == [["a", "b"]]
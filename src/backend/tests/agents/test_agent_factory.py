@@ -0,0 +1,60 @@
+# src/backend/tests/agents/test_agent_factory.py
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+HERE = os.path.dirname(__file__)
+SRC_BACKEND = os.path.abspath(os.path.join(HERE, "..", ".."))
+if SRC_BACKEND not in sys.path:
+    sys.path.insert(0, SRC_BACKEND)
+
+import pytest
+
+# Environment app_config needs to construct at import time
+MOCK_ENV_VARS = {
+    "AZURE_OPENAI_ENDPOINT": "https://mock-openai-endpoint.azure.com/",
+    "AZURE_AI_SUBSCRIPTION_ID": "00000000-0000-0000-0000-000000000000",
+    "AZURE_AI_RESOURCE_GROUP": "rg-test",
+    "AZURE_AI_PROJECT_NAME": "proj-test",
+    "AZURE_AI_AGENT_ENDPOINT": "https://agents.example.com/",
+}
+
+# Modules other test modules replace with stubs at import time
+STUBBED_MODULES = (
+    "app_config", "context", "context.cosmos_memory_kernel",
+    "helpers", "helpers.azure_credential_utils", "models", "models.messages_kernel",
+)
+
+# Evict any stub of models.messages_kernel left by other test modules
+sys.modules.pop("models.messages_kernel", None)
+sys.modules.pop("models", None)
+preloaded = {name for name in STUBBED_MODULES if name in sys.modules}
+
+with patch.dict(os.environ, MOCK_ENV_VARS, clear=False):
+    from kernel_agents.agent_base import BaseAgent
+    from kernel_agents.agent_factory import AgentFactory
+    from models.messages_kernel import AgentType
+
+# Unload the real modules again, so modules collected later still install their stubs
+for name in STUBBED_MODULES:
+    if name not in preloaded:
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.asyncio
+async def test_create_all_agents_raises_the_failing_create_error():
+    async def create_agent(agent_type, **kwargs):
+        if agent_type == AgentType.PATIENT:
+            raise ValueError("patient agent definition rejected")
+        await asyncio.sleep(0)
+        return MagicMock()
+
+    with patch.object(AgentFactory, "create_agent", side_effect=create_agent), \
+            patch.object(BaseAgent, "_get_pooled_agent_definitions", AsyncMock()):
+        with pytest.raises(ValueError, match="patient agent definition rejected"):
+            await AgentFactory.create_all_agents(
+                session_id="test-session", user_id="test-user", client=MagicMock()
+            )
+    AgentFactory._agent_cache.pop("test-session", None)
@@ -0,0 +1,68 @@
+# src/backend/tests/kernel_tools/test_fhir_summary_tools.py
+
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+SRC_BACKEND = os.path.abspath(os.path.join(HERE, "..", ".."))
+if SRC_BACKEND not in sys.path:
+    sys.path.insert(0, SRC_BACKEND)
+
+import pytest
+
+# Evict any stub of models.messages_kernel left by other test modules
+sys.modules.pop("models.messages_kernel", None)
+sys.modules.pop("models", None)
+
+from kernel_tools import fhir_summary_tools
+from kernel_tools.fhir_summary_tools import FHIRSummaryTools
+
+PATIENTS_DIR = os.path.join(SRC_BACKEND, "data", "patients")
+
+
+def read_bundle(file_name):
+    with open(os.path.join(PATIENTS_DIR, file_name), encoding="utf-8") as file:
+        return file.read()
+
+
+@pytest.mark.asyncio
+async def test_generate_patient_summary():
+    summary = await FHIRSummaryTools.generate_patient_summary(read_bundle("p01-heart.json"))
+    assert summary.startswith("Robert James Henderson is a patient with ")
+    assert not summary.startswith("Error")
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_by_content():
+    FHIRSummaryTools._parse_fhir_data.cache_clear()
+    FHIRSummaryTools._analysis_for.cache_clear()
+    FHIRSummaryTools._summary_for.cache_clear()
+    bundle = read_bundle("p02-lungs.json")
+    first = await FHIRSummaryTools.analyze_patient_data(bundle)
+    second = await FHIRSummaryTools.analyze_patient_data(bundle)
+    await FHIRSummaryTools.generate_patient_summary(bundle)
+    assert first == second
+    assert "**Patient:** Linda Marie Williams" in first
+    assert FHIRSummaryTools._analysis_for.cache_info().hits == 1
+    # The summary reuses the bundle parsed for the analysis
+    parse_info = FHIRSummaryTools._parse_fhir_data.cache_info()
+    assert (parse_info.hits, parse_info.misses) == (1, 1)
+
+
+def test_bundled_patients_are_precomputed():
+    FHIRSummaryTools._summary_for.cache_clear()
+    fhir_summary_tools._precompute_patient_results()
+    misses = FHIRSummaryTools._summary_for.cache_info().misses
+    FHIRSummaryTools._summary_for(read_bundle("p03-healthy.json").strip())
+    assert FHIRSummaryTools._summary_for.cache_info().misses == misses
+
+
+@pytest.mark.asyncio
+async def test_invalid_json():
+    result = await FHIRSummaryTools.generate_patient_summary("{not json")
+    assert result.startswith("Error parsing FHIR data: Invalid JSON format")
+
+
+@pytest.mark.asyncio
+async def test_empty_input():
+    assert await FHIRSummaryTools.analyze_patient_data("   ") == "Error: Please provide FHIR JSON data."
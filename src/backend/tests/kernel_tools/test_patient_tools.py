@@ -0,0 +1,121 @@
+# src/backend/tests/kernel_tools/test_patient_tools.py
+
+import json
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+SRC_BACKEND = os.path.abspath(os.path.join(HERE, "..", ".."))
+if SRC_BACKEND not in sys.path:
+    sys.path.insert(0, SRC_BACKEND)
+
+import pytest
+
+# Evict any stub of models.messages_kernel left by other test modules
+sys.modules.pop("models.messages_kernel", None)
+sys.modules.pop("models", None)
+
+from kernel_tools import _patient_files
+from kernel_tools.patient_tools import PatientLookupError, PatientTools
+
+
+@pytest.fixture
+def loaded_ids(monkeypatch):
+    """Record which patient IDs get loaded instead of reading the data files."""
+    ids = []
+
+    async def fake_load(patient_id):
+        ids.append(patient_id)
+        return f'{{"id": "{patient_id}"}}'
+
+    monkeypatch.setattr(PatientTools, "_load_patient_file", staticmethod(fake_load))
+    return ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["Robert James Henderson", "  robert   JAMES henderson "])
+async def test_get_patient_by_name_matches(loaded_ids, query):
+    result = await PatientTools.get_patient_by_name(query)
+    assert result == '{"id": "patient-p01"}'
+    assert loaded_ids == ["patient-p01"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["Robert Henderson", "Henderson", "Robert Jmes Henderson"])
+async def test_get_patient_by_name_near_match_is_only_suggested(loaded_ids, query):
+    result = await PatientTools.get_patient_by_name(query)
+    assert result == (
+        f"Error: Patient name '{query}' not found. "
+        "Did you mean: Robert James Henderson? Confirm the name with the user. Available names: "
+        "Robert James Henderson, Linda Marie Williams, Alex Jordan Thompson"
+    )
+    assert loaded_ids == []
+
+
+@pytest.mark.asyncio
+async def test_get_patient_by_name_unknown(loaded_ids):
+    result = await PatientTools.get_patient_by_name("Jane Doe")
+    assert result == (
+        "Error: Patient name 'Jane Doe' not found. Available names: "
+        "Robert James Henderson, Linda Marie Williams, Alex Jordan Thompson"
+    )
+    assert loaded_ids == []
+
+
+@pytest.mark.asyncio
+async def test_get_patient_by_name_empty(loaded_ids):
+    assert await PatientTools.get_patient_by_name("  ") == "Error: Please provide a patient name."
+    assert loaded_ids == []
+
+
+@pytest.mark.asyncio
+async def test_get_patient_by_name_missing_file(monkeypatch):
+    monkeypatch.setitem(_patient_files.FILE_PATHS, "patient-p02", "/nonexistent/p02-lungs.json")
+    result = await PatientTools.get_patient_by_name("Linda Marie Williams")
+    assert result == "Error: Patient file not found: /nonexistent/p02-lungs.json"
+
+
+@pytest.mark.asyncio
+async def test_load_patient_file_unknown_id():
+    with pytest.raises(PatientLookupError, match="No file mapping found for patient ID: patient-p99"):
+        await PatientTools._load_patient_file("patient-p99")
+
+
+@pytest.mark.asyncio
+async def test_load_patient_file_cold_read(monkeypatch):
+    file_path = _patient_files.FILE_PATHS["patient-p03"]
+    monkeypatch.delitem(_patient_files._CONTENTS, file_path)
+    content = await PatientTools._load_patient_file("patient-p03")
+    assert _patient_files._CONTENTS[file_path] == content
+    assert '"resourceType"' in content
+
+
+@pytest.mark.asyncio
+async def test_get_patients_by_names(loaded_ids):
+    result = await PatientTools.get_patients_by_names(
+        "Robert James Henderson, Jane Doe,, robert  james henderson , Robert Henderson, Alex Jordan Thompson"
+    )
+    assert json.loads(result) == {
+        "Robert James Henderson": {"id": "patient-p01"},
+        "Jane Doe": PatientTools._name_not_found("Jane Doe"),
+        "robert  james henderson": "Same patient as 'Robert James Henderson' (patient-p01)",
+        "Robert Henderson": PatientTools._name_not_found("Robert Henderson"),
+        "Alex Jordan Thompson": {"id": "patient-p03"},
+    }
+    assert loaded_ids == ["patient-p01", "patient-p03"]
+
+
+@pytest.mark.asyncio
+async def test_get_patients_by_names_invalid_file(monkeypatch):
+    async def fake_load(patient_id):
+        return '{"id": "truncated'
+
+    monkeypatch.setattr(PatientTools, "_load_patient_file", staticmethod(fake_load))
+    result = json.loads(await PatientTools.get_patients_by_names("Linda Marie Williams"))
+    assert result["Linda Marie Williams"].startswith("Error: Patient file for patient-p02 is not valid JSON")
+
+
+@pytest.mark.asyncio
+async def test_get_patients_by_names_empty(loaded_ids):
+    assert await PatientTools.get_patients_by_names(" , ") == "Error: Please provide at least one patient name."
+    assert loaded_ids == []
@@ -0,0 +1,60 @@
+# src/backend/tests/kernel_tools/test_summary_validation_tools.py
+
+import json
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+SRC_BACKEND = os.path.abspath(os.path.join(HERE, "..", ".."))
+if SRC_BACKEND not in sys.path:
+    sys.path.insert(0, SRC_BACKEND)
+
+import pytest
+
+from kernel_tools.summary_validation_tools import SummaryValidationTools
+
+
+@pytest.mark.asyncio
+async def test_completeness_valid_json_summary():
+    summary = json.dumps({"full_name": "Linda Marie Williams", "birthDate": "1961-02-03", "procedures": ["Spirometry"]})
+    result = json.loads(await SummaryValidationTools.validate_summary_completeness(summary))
+    assert result["is_valid"] is True
+    assert result["missing_fields"] == []
+
+
+@pytest.mark.asyncio
+async def test_completeness_ignores_empty_fields():
+    summary = json.dumps({"patient_name": "", "age": 63, "conditions": []})
+    result = json.loads(await SummaryValidationTools.validate_summary_completeness(summary))
+    assert result["is_valid"] is False
+    assert result["missing_fields"] == ["❌ Patient Name", "❌ Recent Medical Events"]
+
+
+@pytest.mark.asyncio
+async def test_completeness_raw_text_patterns():
+    summary = "Patient: Robert James Henderson, 67 years old. Diagnosis: coronary artery disease."
+    result = json.loads(await SummaryValidationTools.validate_summary_completeness(summary))
+    assert result["is_valid"] is True
+    assert len(result["present_fields"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_completeness_raw_text_missing_events():
+    summary = "FULL NAME: Linda Marie Williams, 63 Y/O, seen for a routine visit."
+    result = json.loads(await SummaryValidationTools.validate_summary_completeness(summary))
+    assert result["is_valid"] is False
+    assert result["present_fields"] == ["✅ Patient Name", "✅ Patient Age"]
+    assert result["missing_fields"] == ["❌ Recent Medical Events"]
+
+
+@pytest.mark.asyncio
+async def test_report_embeds_validator_results():
+    summary = json.dumps({"name": "Alex Jordan Thompson", "age": 34, "diagnoses": ["Seasonal allergies"]})
+    report = json.loads(await SummaryValidationTools.generate_validation_report(summary))["summary_validation_report"]
+    assert report["completeness_check"] == json.loads(await SummaryValidationTools.validate_summary_completeness(summary))
+    assert report["format_check"] == json.loads(await SummaryValidationTools.validate_summary_format(summary))
+    assert report["required_fields_status"] == {
+        "patient_name": "✅ Present",
+        "patient_age": "✅ Present",
+        "recent_medical_events": "✅ Present",
+    }
@@ -4,71 +4,119 @@ Test script to verify that the Patient agent is being properly selected by the p
 """
 
 import asyncio
+import functools
+import io
 import logging
 import sys
 import os
+from typing import TYPE_CHECKING
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'backend'))
 
-from kernel_agents.planner_agent import PlannerAgent
-from kernel_tools.patient_tools import PatientTools
-from kernel_tools.generic_tools import GenericTools
-from models.messages_kernel import InputTask, AgentType
+# The backend modules are imported by the checks that use them, so loading this
+# file (e.g. during pytest collection) does not pull in the planner and its config
+if TYPE_CHECKING:
+    from kernel_agents.planner_agent import PlannerAgent
 
-async def test_patient_agent_tools():
-    """Test that Patient agent tools are properly exposed to planner."""
-    
-    print("Testing Patient Agent Tools Registration...")
-    
-    # Create a mock planner agent to test the tools list
-    planner = PlannerAgent(
+@functools.lru_cache(maxsize=1)
+def _get_planner() -> "PlannerAgent":
+    """Create the planner once and share it between checks."""
+    from kernel_agents.planner_agent import PlannerAgent
+
+    return PlannerAgent(
         session_id="test-session",
         user_id="test-user",
         memory_store=None,  # We'll skip memory store for this test
     )
+
+@functools.lru_cache(maxsize=8)
+def _build_planner_args(objective: str) -> dict:
+    """Build the planner's template arguments for an objective, once per objective."""
+    return _get_planner()._generate_args(objective)
+
+@functools.lru_cache(maxsize=1)
+def _tool_names_by_agent() -> dict:
+    """Map each agent name to its tool function names, read from the tool classes."""
+    from kernel_tools.fhir_summary_tools import FHIRSummaryTools
+    from kernel_tools.generic_tools import GenericTools
+    from kernel_tools.patient_tools import PatientTools
+    from kernel_tools.summary_validation_tools import SummaryValidationTools
+    from models.messages_kernel import AgentType
+
+    return {
+        AgentType.GENERIC.value: frozenset(GenericTools.get_all_kernel_functions()),
+        AgentType.PATIENT.value: frozenset(PatientTools.get_all_kernel_functions()),
+        AgentType.FHIR_SUMMARY.value: frozenset(FHIRSummaryTools.get_all_kernel_functions()),
+        AgentType.SUMMARY_VALIDATION.value: frozenset(SummaryValidationTools.get_all_kernel_functions()),
+    }
+
+async def test_patient_agent_tools():
+    """Test that Patient agent tools are properly exposed to planner."""
     
-    print(f"Available agents: {planner._available_agents}")
-    print(f"Agent tools list keys: {list(planner._agent_tools_list.keys())}")
-    
-    # Test the tools generation
-    args = planner._generate_args("Get patient information for patient-p01")
-    
-    print(f"Objective: Get patient information for patient-p01")
-    print(f"Agents string: {args['agents_str']}")
-    print(f"Tools list length: {len(args['tools_str'])}")
-    
-    # Check if Patient agent tools are included
-    patient_tools_included = False
-    for tools in args['tools_str']:
-        if 'get_patient_by_id' in tools:
-            patient_tools_included = True
-            print("✅ Patient agent tools found in planner tools list!")
-            print(f"Patient tools: {tools}")
-            break
-    
-    if not patient_tools_included:
-        print("❌ Patient agent tools NOT found in planner tools list!")
-        print("Available tools:")
-        for i, tools in enumerate(args['tools_str']):
-            print(f"  Tool set {i}: {tools[:100]}...")
+    from models.messages_kernel import AgentType
     
-    return patient_tools_included
+    out = io.StringIO()
+    try:
+        print("Testing Patient Agent Tools Registration...", file=out)
+    
+        # Create a mock planner agent to test the tools list
+        planner = _get_planner()
+    
+        print(f"Available agents: {planner._available_agents}", file=out)
+        print(f"Agent tools list keys: {list(planner._agent_tools_list.keys())}", file=out)
+    
+        # Test the tools generation
+        args = _build_planner_args("Get patient information for patient-p01")
+    
+        print(f"Objective: Get patient information for patient-p01", file=out)
+        print(f"Agents string: {args['agents_str']}", file=out)
+        print(f"Tools list length: {len(args['tools_str'])}", file=out)
+    
+        # Check that the Patient agent has the tool, and that its tools reach the planner's prompt
+        tool_names = _tool_names_by_agent()
+        patient_tools_included = (
+            'get_patient_by_name' in tool_names.get(AgentType.PATIENT.value, ())
+            and any('get_patient_by_name' in tools for tools in args['tools_str'])
+        )
+    
+        if patient_tools_included:
+            print("✅ Patient agent tools found in planner tools list!", file=out)
+            print(f"Patient tools: {planner._agent_tools_list[AgentType.PATIENT]}", file=out)
+        else:
+            print("❌ Patient agent tools NOT found in planner tools list!", file=out)
+            print("Available tools:", file=out)
+            for agent, names in tool_names.items():
+                print(f"  {agent}: {', '.join(sorted(names))}", file=out)
+    
+        return patient_tools_included
+    finally:
+        # Write the check's output in one go, so concurrent checks don't interleave
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 async def test_patient_tools_directly():
     """Test Patient tools directly."""
     
-    print("\nTesting Patient Tools Directly...")
+    from kernel_tools.patient_tools import PatientTools
     
-    # Test the generate_tools_json_doc method
+    out = io.StringIO()
     try:
-        tools_json = PatientTools.generate_tools_json_doc()
-        print(f"✅ PatientTools.generate_tools_json_doc() works!")
-        print(f"Tools JSON: {tools_json}")
-        return True
-    except Exception as e:
-        print(f"❌ PatientTools.generate_tools_json_doc() failed: {e}")
-        return False
+        print("\nTesting Patient Tools Directly...", file=out)
+    
+        # Test the generate_tools_json_doc method
+        try:
+            tools_json = PatientTools.generate_tools_json_doc()
+            print(f"✅ PatientTools.generate_tools_json_doc() works!", file=out)
+            print(f"Tools JSON: {tools_json}", file=out)
+            return True
+        except Exception as e:
+            print(f"❌ PatientTools.generate_tools_json_doc() failed: {e}", file=out)
+            return False
+    finally:
+        # Write the check's output in one go, so concurrent checks don't interleave
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 async def main():
     """Main test function."""
@@ -79,10 +127,12 @@ async def main():
     print("=" * 50)
     
     # Test 1: Test patient tools directly
-    tools_test = await test_patient_tools_directly()
-    
     # Test 2: Test planner agent integration
-    integration_test = await test_patient_agent_tools()
+    # The tests share no state, so run them concurrently
+    tools_test, integration_test = await asyncio.gather(
+        test_patient_tools_directly(),
+        test_patient_agent_tools(),
+    )
     
     print("\n" + "=" * 50)
     print("TEST RESULTS:")